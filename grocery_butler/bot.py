@@ -17,17 +17,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import discord
 from discord import app_commands
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
     from grocery_butler.config import Config
     from grocery_butler.models import (
         BrandPreference,
         CartSummary,
         InventoryItem,
+        InventoryUpdate,
         ParsedMeal,
         ShoppingListItem,
     )
@@ -36,6 +40,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Status emoji mapping for inventory display
 _STATUS_EMOJI: dict[str, str] = {
     "on_hand": "\u2705",
@@ -46,6 +52,22 @@ _STATUS_EMOJI: dict[str, str] = {
 _MAX_MESSAGE_LENGTH = 1900
 
 
+async def _to_thread_fast(fn: Callable[..., _T], *args: Any) -> _T:
+    """Run a blocking call on the default executor.
+
+    Like :func:`asyncio.to_thread` but without copying the current
+    ``contextvars`` context, which the store calls don't need.
+
+    Args:
+        fn: Blocking callable to run.
+        *args: Positional arguments for ``fn``.
+
+    Returns:
+        The return value of ``fn``.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+
 def _truncate(text: str, limit: int = _MAX_MESSAGE_LENGTH) -> str:
     """Truncate text to fit within Discord message limits.
 
@@ -254,7 +276,8 @@ class _OrderConfirmView(discord.ui.View):
     """Discord UI view with Confirm / Cancel buttons for order submission.
 
     Stores a pre-built ``CartSummary`` so the confirmed order matches the
-    preview the user approved — no second build pass is needed.
+    preview the user approved — no second build pass is needed. The
+    pipeline is the bot's shared instance, so the view never closes it.
 
     Attributes:
         pipeline: The SafewayPipeline instance to use for submission.
@@ -299,7 +322,6 @@ class _OrderConfirmView(discord.ui.View):
             logger.exception("Order submission failed")
             await interaction.followup.send("Order submission failed.")
         finally:
-            await asyncio.to_thread(self._pipeline.close)
             self.stop()
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.grey)
@@ -314,14 +336,9 @@ class _OrderConfirmView(discord.ui.View):
             interaction: Discord interaction context.
             button: The button that was pressed.
         """
-        await asyncio.to_thread(self._pipeline.close)
         await interaction.response.send_message("Order cancelled.")
         self.stop()
 
-    async def on_timeout(self) -> None:
-        """Clean up pipeline resources when the view times out."""
-        await asyncio.to_thread(self._pipeline.close)
-
 
 def _make_bot_anthropic_client(config: Config) -> object | None:
     """Create an Anthropic client from bot config.
@@ -415,6 +432,32 @@ def _format_order_result(result: OrderResult) -> str:
     return "\n".join(lines)
 
 
+class _GroceryButlerClient(discord.Client):
+    """Discord client that owns the bot's shared Safeway pipeline.
+
+    The pipeline is created lazily by the ``/order`` commands and its
+    HTTP session is closed when the client shuts down.
+
+    Attributes:
+        safeway_pipeline: Shared pipeline, or None until first used.
+    """
+
+    def __init__(self, *, intents: discord.Intents) -> None:
+        """Initialize the client.
+
+        Args:
+            intents: Gateway intents to request.
+        """
+        super().__init__(intents=intents)
+        self.safeway_pipeline: SafewayPipeline | None = None
+
+    async def close(self) -> None:
+        """Close the shared pipeline's HTTP session, then the client."""
+        if self.safeway_pipeline is not None:
+            await asyncio.to_thread(self.safeway_pipeline.close)
+        await super().close()
+
+
 def create_bot(config: Config) -> discord.Client:
     """Create and configure the Discord bot with all slash commands.
 
@@ -424,15 +467,28 @@ def create_bot(config: Config) -> discord.Client:
     Returns:
         Configured Discord client ready to run.
     """
+    from grocery_butler.claude_utils import items_from_string
     from grocery_butler.consolidator import Consolidator
     from grocery_butler.meal_parser import MealParser
+    from grocery_butler.models import (
+        BrandMatchType,
+        BrandPreference,
+        BrandPreferenceType,
+        IngredientCategory,
+        InventoryItem,
+        InventoryStatus,
+    )
     from grocery_butler.pantry_manager import PantryManager
     from grocery_butler.recipe_store import RecipeStore
+    from grocery_butler.safeway_pipeline import (
+        SafewayPipeline,
+        SafewayPipelineError,
+    )
 
     intents = discord.Intents.default()
     intents.message_content = True
 
-    client = discord.Client(intents=intents)
+    client = _GroceryButlerClient(intents=intents)
     tree = app_commands.CommandTree(client)
 
     # Store references on the client for access in event handlers
@@ -464,7 +520,7 @@ def create_bot(config: Config) -> discord.Client:
         await interaction.response.defer()
 
         try:
-            meal_names = [m.strip() for m in meals.split(",") if m.strip()]
+            meal_names = [m for raw in meals.split(",") if (m := raw.strip())]
             if not meal_names:
                 await interaction.followup.send(
                     "Please provide at least one meal name."
@@ -611,93 +667,54 @@ def create_bot(config: Config) -> discord.Client:
                 "Sorry, something went wrong showing inventory."
             )
 
-    @stock_group.command(name="out", description="Mark an item as out of stock")
-    @app_commands.describe(item="Item name")
-    async def stock_out(interaction: discord.Interaction, item: str) -> None:
-        """Mark an item as out of stock.
+    def _make_status_handler(
+        command: str, status: InventoryStatus, verb: str
+    ) -> Callable[[discord.Interaction, str], Coroutine[Any, Any, None]]:
+        """Build a ``/stock`` subcommand callback that sets one status.
 
         Args:
-            interaction: Discord interaction context.
-            item: Item name to mark as out.
-        """
-        try:
-            from grocery_butler.models import InventoryStatus
-
-            existing = await asyncio.to_thread(pantry_manager.get_item, item)
-            if existing is None:
-                await interaction.response.send_message(
-                    f"Item '{item}' not found. Use `/stock add` to track it first."
-                )
-                return
-            await asyncio.to_thread(
-                pantry_manager.update_status, item, InventoryStatus.OUT
-            )
-            await interaction.response.send_message(
-                f"Marked **{item}** as out of stock."
-            )
-        except Exception:
-            logger.exception("Error in /stock out")
-            await interaction.response.send_message(
-                "Sorry, something went wrong updating inventory."
-            )
-
-    @stock_group.command(name="low", description="Mark an item as running low")
-    @app_commands.describe(item="Item name")
-    async def stock_low(interaction: discord.Interaction, item: str) -> None:
-        """Mark an item as running low.
+            command: Subcommand name, used in the error log message.
+            status: Inventory status the handler applies.
+            verb: Human-readable description of the status for replies.
 
-        Args:
-            interaction: Discord interaction context.
-            item: Item name to mark as low.
+        Returns:
+            Coroutine function suitable for registering as a subcommand.
         """
-        try:
-            from grocery_butler.models import InventoryStatus
 
-            existing = await asyncio.to_thread(pantry_manager.get_item, item)
-            if existing is None:
+        async def handler(interaction: discord.Interaction, item: str) -> None:
+            """Mark an inventory item with the bound status.
+
+            Args:
+                interaction: Discord interaction context.
+                item: Item name to update.
+            """
+            try:
+                existing = await asyncio.to_thread(pantry_manager.get_item, item)
+                if existing is None:
+                    await interaction.response.send_message(
+                        f"Item '{item}' not found. Use `/stock add` to track it first."
+                    )
+                    return
+                await asyncio.to_thread(pantry_manager.update_status, item, status)
+                await interaction.response.send_message(f"Marked **{item}** as {verb}.")
+            except Exception:
+                logger.exception("Error in /stock %s", command)
                 await interaction.response.send_message(
-                    f"Item '{item}' not found. Use `/stock add` to track it first."
+                    "Sorry, something went wrong updating inventory."
                 )
-                return
-            await asyncio.to_thread(
-                pantry_manager.update_status, item, InventoryStatus.LOW
-            )
-            await interaction.response.send_message(
-                f"Marked **{item}** as running low."
-            )
-        except Exception:
-            logger.exception("Error in /stock low")
-            await interaction.response.send_message(
-                "Sorry, something went wrong updating inventory."
-            )
 
-    @stock_group.command(name="good", description="Mark an item as on hand")
-    @app_commands.describe(item="Item name")
-    async def stock_good(interaction: discord.Interaction, item: str) -> None:
-        """Mark an item as on hand.
-
-        Args:
-            interaction: Discord interaction context.
-            item: Item name to mark as on_hand.
-        """
-        try:
-            from grocery_butler.models import InventoryStatus
+        return handler
 
-            existing = await asyncio.to_thread(pantry_manager.get_item, item)
-            if existing is None:
-                await interaction.response.send_message(
-                    f"Item '{item}' not found. Use `/stock add` to track it first."
-                )
-                return
-            await asyncio.to_thread(
-                pantry_manager.update_status, item, InventoryStatus.ON_HAND
-            )
-            await interaction.response.send_message(f"Marked **{item}** as on hand.")
-        except Exception:
-            logger.exception("Error in /stock good")
-            await interaction.response.send_message(
-                "Sorry, something went wrong updating inventory."
+    for command, description, status, verb in (
+        ("out", "Mark an item as out of stock", InventoryStatus.OUT, "out of stock"),
+        ("low", "Mark an item as running low", InventoryStatus.LOW, "running low"),
+        ("good", "Mark an item as on hand", InventoryStatus.ON_HAND, "on hand"),
+    ):
+        stock_group.command(name=command, description=description)(
+            app_commands.describe(item="Item name")(
+                _make_status_handler(command, status, verb)
             )
+        )
 
     @stock_group.command(name="add", description="Track a new inventory item")
     @app_commands.describe(item="Item name", category="Category (e.g. produce, dairy)")
@@ -714,12 +731,6 @@ def create_bot(config: Config) -> discord.Client:
             category: Category string.
         """
         try:
-            from grocery_butler.models import (
-                IngredientCategory,
-                InventoryItem,
-                InventoryStatus,
-            )
-
             try:
                 cat_enum = IngredientCategory(category.lower())
             except ValueError:
@@ -810,7 +821,7 @@ def create_bot(config: Config) -> discord.Client:
             interaction: Discord interaction context.
         """
         try:
-            prefs = await asyncio.to_thread(recipe_store.get_brand_preferences)
+            prefs = await _to_thread_fast(recipe_store.get_brand_preferences)
             result = _format_brands(prefs)
             await interaction.response.send_message(result)
         except Exception:
@@ -834,19 +845,13 @@ def create_bot(config: Config) -> discord.Client:
             brand: The preferred brand name.
         """
         try:
-            from grocery_butler.models import (
-                BrandMatchType,
-                BrandPreference,
-                BrandPreferenceType,
-            )
-
             pref = BrandPreference(
                 match_target=target.lower(),
                 match_type=BrandMatchType.INGREDIENT,
                 brand=brand,
                 preference_type=BrandPreferenceType.PREFERRED,
             )
-            await asyncio.to_thread(recipe_store.add_brand_preference, pref)
+            await _to_thread_fast(recipe_store.add_brand_preference, pref)
             await interaction.response.send_message(
                 f"Set preferred brand for **{target}**: {brand}"
             )
@@ -866,19 +871,13 @@ def create_bot(config: Config) -> discord.Client:
             brand: Brand name to avoid.
         """
         try:
-            from grocery_butler.models import (
-                BrandMatchType,
-                BrandPreference,
-                BrandPreferenceType,
-            )
-
             pref = BrandPreference(
                 match_target="*",
                 match_type=BrandMatchType.CATEGORY,
                 brand=brand,
                 preference_type=BrandPreferenceType.AVOID,
             )
-            await asyncio.to_thread(recipe_store.add_brand_preference, pref)
+            await _to_thread_fast(recipe_store.add_brand_preference, pref)
             await interaction.response.send_message(f"Added **{brand}** to avoid list.")
         except Exception:
             logger.exception("Error in /brands avoid")
@@ -896,16 +895,9 @@ def create_bot(config: Config) -> discord.Client:
             target: The target to clear preferences for.
         """
         try:
-            prefs = await asyncio.to_thread(recipe_store.get_brand_preferences)
-            removed = 0
-            for idx, pref in enumerate(prefs):
-                if pref.match_target.lower() == target.lower():
-                    # Brand preference IDs start at 1 and are sequential
-                    # Re-fetch to get current IDs
-                    await asyncio.to_thread(
-                        recipe_store.remove_brand_preference, idx + 1
-                    )
-                    removed += 1
+            removed = await _to_thread_fast(
+                recipe_store.remove_brand_preferences_for_target, target
+            )
 
             if removed > 0:
                 await interaction.response.send_message(
@@ -942,7 +934,7 @@ def create_bot(config: Config) -> discord.Client:
             interaction: Discord interaction context.
         """
         try:
-            recipes = await asyncio.to_thread(recipe_store.list_recipes)
+            recipes = await _to_thread_fast(recipe_store.list_recipes)
             result = _format_recipes(recipes)
             await interaction.response.send_message(result)
         except Exception:
@@ -961,7 +953,7 @@ def create_bot(config: Config) -> discord.Client:
             name: Recipe name to look up.
         """
         try:
-            meal = await asyncio.to_thread(recipe_store.find_recipe, name)
+            meal = await _to_thread_fast(recipe_store.find_recipe, name)
             if meal is None:
                 await interaction.response.send_message(f"Recipe '{name}' not found.")
                 return
@@ -983,21 +975,12 @@ def create_bot(config: Config) -> discord.Client:
             name: Recipe name to delete.
         """
         try:
-            recipes = await asyncio.to_thread(recipe_store.list_recipes)
-            from grocery_butler.recipe_store import normalize_recipe_name
-
-            normalized = normalize_recipe_name(name)
-            found_id: int | None = None
-            for recipe in recipes:
-                if str(recipe.get("name", "")) == normalized:
-                    found_id = int(str(recipe.get("id", 0)))
-                    break
-
-            if found_id is None or found_id == 0:
+            found_id = await _to_thread_fast(recipe_store.find_recipe_id, name)
+            if found_id is None:
                 await interaction.response.send_message(f"Recipe '{name}' not found.")
                 return
 
-            await asyncio.to_thread(recipe_store.delete_recipe, found_id)
+            await _to_thread_fast(recipe_store.delete_recipe, found_id)
             await interaction.response.send_message(f"Deleted recipe **{name}**.")
         except Exception:
             logger.exception("Error in /recipes forget")
@@ -1026,7 +1009,7 @@ def create_bot(config: Config) -> discord.Client:
             interaction: Discord interaction context.
         """
         try:
-            prefs = await asyncio.to_thread(recipe_store.get_all_preferences)
+            prefs = await _to_thread_fast(recipe_store.get_all_preferences)
             result = _format_preferences(prefs)
             await interaction.response.send_message(result)
         except Exception:
@@ -1046,7 +1029,7 @@ def create_bot(config: Config) -> discord.Client:
             value: Preference value.
         """
         try:
-            await asyncio.to_thread(recipe_store.set_preference, key, value)
+            await _to_thread_fast(recipe_store.set_preference, key, value)
             await interaction.response.send_message(f"Set **{key}** = {value}")
         except Exception:
             logger.exception("Error in /preferences set")
@@ -1060,6 +1043,24 @@ def create_bot(config: Config) -> discord.Client:
     # /order command group
     # ------------------------------------------------------------------
 
+    # One pipeline (and Safeway HTTP session) per bot process, created on
+    # first use so a bot without Safeway credentials still starts.
+    def _get_pipeline() -> SafewayPipeline:
+        """Return the shared Safeway pipeline, creating it on first use.
+
+        Returns:
+            The bot's SafewayPipeline instance.
+
+        Raises:
+            SafewayPipelineError: If Safeway configuration is missing.
+        """
+        if client.safeway_pipeline is None:
+            anthropic_client = _make_bot_anthropic_client(config)
+            client.safeway_pipeline = SafewayPipeline(
+                config, config.database_path, anthropic_client
+            )
+        return client.safeway_pipeline
+
     order_group = app_commands.Group(
         name="order",
         description="Safeway grocery ordering",
@@ -1079,25 +1080,15 @@ def create_bot(config: Config) -> discord.Client:
         await interaction.response.defer()
 
         try:
-            from grocery_butler.claude_utils import items_from_string
-            from grocery_butler.safeway_pipeline import (
-                SafewayPipeline,
-                SafewayPipelineError,
-            )
-
             shopping_items = items_from_string(items)
             if not shopping_items:
                 await interaction.followup.send("Please provide item names.")
                 return
 
-            anthropic_client = _make_bot_anthropic_client(config)
-            pipeline = SafewayPipeline(config, config.database_path, anthropic_client)
-            try:
-                cart = await asyncio.to_thread(pipeline.build_cart_only, shopping_items)
-                result = _format_cart_summary(cart)
-                await interaction.followup.send(f"Cart preview:\n{result}")
-            finally:
-                await asyncio.to_thread(pipeline.close)
+            pipeline = _get_pipeline()
+            cart = await asyncio.to_thread(pipeline.build_cart_only, shopping_items)
+            result = _format_cart_summary(cart)
+            await interaction.followup.send(f"Cart preview:\n{result}")
 
         except SafewayPipelineError as exc:
             await interaction.followup.send(f"Pipeline error: {exc}")
@@ -1119,29 +1110,18 @@ def create_bot(config: Config) -> discord.Client:
         await interaction.response.defer()
 
         try:
-            from grocery_butler.claude_utils import items_from_string
-            from grocery_butler.safeway_pipeline import (
-                SafewayPipeline,
-                SafewayPipelineError,
-            )
-
             shopping_items = items_from_string(items)
             if not shopping_items:
                 await interaction.followup.send("Please provide item names.")
                 return
 
-            anthropic_client = _make_bot_anthropic_client(config)
-            pipeline = SafewayPipeline(config, config.database_path, anthropic_client)
-            try:
-                cart = await asyncio.to_thread(pipeline.build_cart_only, shopping_items)
-                preview = _format_cart_summary(cart)
-                view = _OrderConfirmView(pipeline, cart)
-                await interaction.followup.send(
-                    f"{preview}\n\nSubmit this order?", view=view
-                )
-            except Exception:
-                await asyncio.to_thread(pipeline.close)
-                raise
+            pipeline = _get_pipeline()
+            cart = await asyncio.to_thread(pipeline.build_cart_only, shopping_items)
+            preview = _format_cart_summary(cart)
+            view = _OrderConfirmView(pipeline, cart)
+            await interaction.followup.send(
+                f"{preview}\n\nSubmit this order?", view=view
+            )
 
         except SafewayPipelineError as exc:
             await interaction.followup.send(f"Pipeline error: {exc}")
@@ -1157,6 +1137,21 @@ def create_bot(config: Config) -> discord.Client:
     # Event handlers
     # ------------------------------------------------------------------
 
+    @client.event
+    async def setup_hook() -> None:
+        """Size the default executor used by ``asyncio.to_thread``.
+
+        Nearly every command hops to a worker thread for DB, Claude, or
+        Safeway calls; the stdlib default of ``min(32, cpu_count + 4)``
+        queues them under a burst of commands.
+        """
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=config.thread_pool_size,
+                thread_name_prefix="grocery-butler",
+            )
+        )
+
     @client.event
     async def on_ready() -> None:
         """Handle bot startup: sync commands and log ready state."""
@@ -1206,23 +1201,26 @@ def create_bot(config: Config) -> discord.Client:
             if not updates:
                 return
 
-            # Process high-confidence updates
-            high_conf = [u for u in updates if u.confidence >= 0.8]
-            low_conf = [u for u in updates if u.confidence < 0.8]
+            # Partition by confidence in one pass
+            high_conf: list[InventoryUpdate] = []
+            low_conf: list[InventoryUpdate] = []
+            for update in updates:
+                if update.confidence >= 0.8:
+                    high_conf.append(update)
+                else:
+                    low_conf.append(update)
 
-            for update in high_conf:
+            if high_conf:
                 await asyncio.to_thread(
-                    pantry_manager.update_status,
-                    update.ingredient,
-                    update.new_status,
+                    pantry_manager.update_status_bulk,
+                    [(u.ingredient, u.new_status) for u in high_conf],
                 )
-
-            if high_conf:
+                emoji_for = _STATUS_EMOJI.get
                 lines = []
                 for update in high_conf:
-                    emoji = _STATUS_EMOJI.get(update.new_status.value, "")
+                    status = update.new_status.value
                     lines.append(
-                        f"{emoji} **{update.ingredient}** -> {update.new_status.value}"
+                        f"{emoji_for(status, '')} **{update.ingredient}** -> {status}"
                     )
                 await message.reply("Updated inventory:\n" + "\n".join(lines))
 
@@ -7,9 +7,11 @@ options, and calculating totals.
 
 from __future__ import annotations
 
+import functools
 import logging
 import math
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from grocery_butler.models import (
@@ -29,6 +31,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on items processed concurrently. Each item is dominated by
+# network latency (Safeway search + Claude selection), so a small pool
+# overlaps those round-trips without flooding either API.
+_MAX_ITEM_WORKERS = 8
+
+# Leading number of a product size string such as "1.5 gal" or " 16 oz".
+_SIZE_RE = re.compile(r"\s*([\d.]+)")
+
 
 class CartBuildError(Exception):
     """Raised when cart building encounters an unrecoverable error."""
@@ -93,8 +103,14 @@ class CartBuilder:
                 all_items.append(ri)
                 restock_set.add(ri.ingredient)
 
-        for item in all_items:
-            result = self._process_item(item)
+        # One extra worker so the fulfillment lookup overlaps item work.
+        workers = min(_MAX_ITEM_WORKERS, len(all_items)) + 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fulfillment_future = executor.submit(self._get_fulfillment_options)
+            results = list(executor.map(self._process_item, all_items))
+            fulfillment_options = fulfillment_future.result()
+
+        for item, result in zip(all_items, results, strict=True):
             is_restock = item.ingredient in restock_set
 
             if result is None:
@@ -107,10 +123,11 @@ class CartBuilder:
             elif isinstance(result, SubstitutionResult):
                 substituted.append(result)
 
-        fulfillment_options = self._get_fulfillment_options()
-        recommended = _recommend_fulfillment(fulfillment_options)
+        options_by_type = _index_options(fulfillment_options)
+        recommended = _recommend_fulfillment(options_by_type)
         subtotal = _calculate_subtotal(cart_items, restock_cart)
-        fee = _get_fulfillment_fee(fulfillment_options, recommended)
+        chosen = options_by_type.get(recommended)
+        fee = chosen.fee if chosen is not None else 0.0
         estimated_total = round(subtotal + fee, 2)
 
         return CartSummary(
@@ -230,16 +247,20 @@ def _calculate_quantity(
     return max(1, math.ceil(needed))
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_product_size(size: str) -> float:
     """Extract numeric quantity from a product size string.
 
+    Memoized because the same handful of size strings recur across
+    every cart.
+
     Args:
         size: Product size string like '2 lb', '16 oz', '1 gal'.
 
     Returns:
         Numeric quantity or 0.0 if unparseable.
     """
-    match = re.match(r"([\d.]+)", size.strip())
+    match = _SIZE_RE.match(size)
     if match:
         try:
             return float(match.group(1))
@@ -254,6 +275,9 @@ def _calculate_subtotal(
 ) -> float:
     """Calculate cart subtotal from all items.
 
+    Costs are summed as integer cents so many small prices don't
+    accumulate binary floating-point error.
+
     Args:
         items: Regular cart items.
         restock_items: Restock queue cart items.
@@ -261,52 +285,51 @@ def _calculate_subtotal(
     Returns:
         Rounded subtotal.
     """
-    total = sum(item.estimated_cost for item in items)
-    total += sum(item.estimated_cost for item in restock_items)
-    return round(total, 2)
+    cents = sum(round(item.estimated_cost * 100) for item in items)
+    cents += sum(round(item.estimated_cost * 100) for item in restock_items)
+    return cents / 100
 
 
-def _get_fulfillment_fee(
+def _index_options(
     options: list[FulfillmentOption],
-    recommended: FulfillmentType,
-) -> float:
-    """Get the fee for the recommended fulfillment type.
+) -> dict[FulfillmentType, FulfillmentOption]:
+    """Index fulfillment options by type for constant-time lookup.
+
+    If the API reports a type more than once, the first entry wins.
 
     Args:
         options: Available fulfillment options.
-        recommended: The recommended fulfillment type.
 
     Returns:
-        Fee amount, or 0.0 if not found.
+        Dict mapping each fulfillment type to its option, in API order.
     """
+    indexed: dict[FulfillmentType, FulfillmentOption] = {}
     for option in options:
-        if option.type == recommended:
-            return option.fee
-    return 0.0
+        indexed.setdefault(option.type, option)
+    return indexed
 
 
 def _recommend_fulfillment(
-    options: list[FulfillmentOption],
+    options: dict[FulfillmentType, FulfillmentOption],
 ) -> FulfillmentType:
     """Recommend the best fulfillment option.
 
     Prefers pickup if available (usually free), otherwise delivery.
 
     Args:
-        options: Available fulfillment options.
+        options: Fulfillment options indexed by type.
 
     Returns:
         Recommended fulfillment type.
     """
-    available = [o for o in options if o.available]
-    if not available:
-        return FulfillmentType.PICKUP
-
-    pickup = [o for o in available if o.type == FulfillmentType.PICKUP]
-    if pickup:
+    pickup = options.get(FulfillmentType.PICKUP)
+    if pickup is not None and pickup.available:
         return FulfillmentType.PICKUP
 
-    return available[0].type
+    for option in options.values():
+        if option.available:
+            return option.type
+    return FulfillmentType.PICKUP
 
 
 def _parse_fulfillment_response(
@@ -7,7 +7,11 @@ shopping-list item construction.
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
+import re
+from typing import TYPE_CHECKING, Any
 
 from grocery_butler.models import (
     BrandPreference,
@@ -18,25 +22,63 @@ from grocery_butler.models import (
     Unit,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# orjson is an optional accelerator; fall back to the stdlib parser.
+# Both raise json.JSONDecodeError subclasses on malformed input.
+try:
+    import orjson
+
+    _json_loads: Callable[[str], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Bound once so the avoid-set loop skips the enum attribute lookup.
+_AVOID = BrandPreferenceType.AVOID
+
+# Leading whitespace plus an optional opening fence line with any
+# language tag (```json, ```JSON, bare ```), and whitespace after it.
+_OPENING_FENCE_RE = re.compile(r"\s*(?:```[^\n]*\n\s*)?")
+
 
 def extract_json_text(raw: str) -> str:
     """Extract JSON from a Claude response, stripping markdown fences.
 
+    The opening fence is consumed by one anchored regex match; the
+    closing fence and trailing whitespace are trimmed with C-level
+    ``rstrip`` calls.
+
     Args:
         raw: Raw text from Claude's response.
 
     Returns:
         Cleaned string ready for JSON parsing.
     """
-    text = raw.strip()
-    if text.startswith("```"):
-        first_newline = text.index("\n")
-        text = text[first_newline + 1 :]
+    match = _OPENING_FENCE_RE.match(raw)
+    text = (raw[match.end() :] if match else raw).rstrip()
     if text.endswith("```"):
-        text = text[: -len("```")]
-    return text.strip()
+        text = text[: -len("```")].rstrip()
+    return text
+
+
+def parse_claude_json(raw: str) -> Any:
+    """Strip markdown fences from a Claude response and decode the JSON.
+
+    Uses orjson when it is installed, otherwise :func:`json.loads`.
+
+    Args:
+        raw: Raw text from Claude's response.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON.
+    """
+    return _json_loads(extract_json_text(raw))
 
 
 def filter_avoided_brands(
@@ -52,21 +94,47 @@ def filter_avoided_brands(
     Returns:
         Products not matching any avoided brand.
     """
-    avoided = {
-        pref.brand.lower()
-        for pref in brand_prefs
-        if pref.preference_type == BrandPreferenceType.AVOID
-    }
+    if not products:
+        return products
+    avoided: set[str] | None = None
+    for pref in brand_prefs:
+        if pref.preference_type is _AVOID:
+            if avoided is None:
+                avoided = set()
+            avoided.add(pref.brand.casefold())
     if not avoided:
         return products
-    return [
-        p for p in products if not any(brand in p.name.lower() for brand in avoided)
-    ]
+    if len(avoided) == 1:
+        (brand,) = avoided
+        return [p for p in products if brand not in p.name.casefold()]
+    pattern = _avoided_brand_pattern(frozenset(avoided))
+    return [p for p in products if pattern.search(p.name.casefold()) is None]
+
+
+@functools.lru_cache(maxsize=32)
+def _avoided_brand_pattern(brands: frozenset[str]) -> re.Pattern[str]:
+    """Compile one alternation regex matching any of the avoided brands.
+
+    A single compiled pattern scans each product name once instead of
+    running one substring search per brand. Cached because the avoid
+    list rarely changes between calls.
+
+    Args:
+        brands: Casefolded avoided brand names.
+
+    Returns:
+        Compiled pattern; longest brands are tried first.
+    """
+    ordered = sorted(brands, key=len, reverse=True)
+    return re.compile("|".join(re.escape(brand) for brand in ordered))
 
 
 def make_anthropic_client(api_key: str) -> object | None:
     """Create an Anthropic client from the given API key.
 
+    Clients are reused per API key, so every pipeline stage shares one
+    HTTP connection pool. Failures are not cached.
+
     Args:
         api_key: Anthropic API key string.
 
@@ -74,14 +142,36 @@ def make_anthropic_client(api_key: str) -> object | None:
         Anthropic client instance or None on import failure.
     """
     try:
-        import anthropic
-
-        return anthropic.Anthropic(api_key=api_key)
+        return _cached_anthropic_client(api_key)
     except Exception:
         logger.warning("Anthropic client unavailable; Claude features disabled")
         return None
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_anthropic_client(api_key: str) -> object:
+    """Construct an Anthropic client, memoized by API key.
+
+    Args:
+        api_key: Anthropic API key string.
+
+    Returns:
+        Anthropic client instance.
+    """
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key)
+
+
+# Immutable field values shared by every manually entered item.
+# from_meals is deliberately absent: each item needs its own list.
+_MANUAL_ITEM_DEFAULTS: dict[str, Any] = {
+    "quantity": 1.0,
+    "unit": Unit.EACH,
+    "category": IngredientCategory.OTHER,
+}
+
+
 def items_from_string(items_str: str) -> list[ShoppingListItem]:
     """Convert comma-separated item names to ShoppingListItem list.
 
@@ -91,15 +181,28 @@ def items_from_string(items_str: str) -> list[ShoppingListItem]:
     Returns:
         List of ShoppingListItem with defaults.
     """
-    names = [n.strip() for n in items_str.split(",") if n.strip()]
-    return [
-        ShoppingListItem(
-            ingredient=name.lower(),
-            quantity=1.0,
-            unit=Unit.EACH,
-            category=IngredientCategory.OTHER,
-            search_term=name.lower(),
+    return list(iter_items_from_string(items_str))
+
+
+def iter_items_from_string(items_str: str) -> Iterator[ShoppingListItem]:
+    """Yield a ShoppingListItem for each comma-separated item name.
+
+    Every field is either a constant or a stripped string, so items are
+    built with ``model_construct`` and skip pydantic validation.
+
+    Args:
+        items_str: Comma-separated ingredient names.
+
+    Yields:
+        ShoppingListItem with defaults, in input order.
+    """
+    for token in items_str.split(","):
+        name = token.strip().lower()
+        if not name:
+            continue
+        yield ShoppingListItem.model_construct(
+            ingredient=name,
+            search_term=name,
             from_meals=["manual"],
+            **_MANUAL_ITEM_DEFAULTS,
         )
-        for name in names
-    ]
@@ -9,26 +9,26 @@ into a fully functional terminal-based meal planning tool.
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import logging
 import sys
 from typing import TYPE_CHECKING
 
-from grocery_butler.consolidator import Consolidator
-from grocery_butler.meal_parser import MealParser
-from grocery_butler.models import (
-    CartItem,
-    CartSummary,
-    IngredientCategory,
-    InventoryItem,
-    InventoryStatus,
-    ShoppingListItem,
-)
-from grocery_butler.pantry_manager import PantryManager
-from grocery_butler.recipe_store import RecipeStore
-from grocery_butler.safeway_pipeline import SafewayPipeline, SafewayPipelineError
-
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from grocery_butler.config import Config
+    from grocery_butler.models import (
+        CartItem,
+        CartSummary,
+        Ingredient,
+        InventoryItem,
+        ParsedMeal,
+        ShoppingListItem,
+    )
+    from grocery_butler.pantry_manager import PantryManager
+    from grocery_butler.recipe_store import RecipeStore
 
 
 logger = logging.getLogger(__name__)
@@ -69,6 +69,18 @@ def _make_anthropic_client(api_key: str) -> object | None:
     return make_anthropic_client(api_key)
 
 
+def _split_csv(text: str) -> list[str]:
+    """Split a comma-separated argument into non-empty stripped names.
+
+    Args:
+        text: Comma-separated names, e.g. ``"tacos, , pasta"``.
+
+    Returns:
+        Stripped names with empty entries dropped.
+    """
+    return [name for raw in text.split(",") if (name := raw.strip())]
+
+
 # ------------------------------------------------------------------
 # Output formatting
 # ------------------------------------------------------------------
@@ -86,6 +98,22 @@ _CATEGORY_DISPLAY: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=64)
+def _category_display(cat_key: str) -> str:
+    """Return the display heading for a category key.
+
+    Unknown keys are title-cased from the raw value. Cached, so the
+    fallback string work runs at most once per key.
+
+    Args:
+        cat_key: Category value, e.g. ``"pantry_dry"``.
+
+    Returns:
+        Human-readable category heading.
+    """
+    return _CATEGORY_DISPLAY.get(cat_key) or cat_key.replace("_", " ").title()
+
+
 def _format_shopping_list(items: list[ShoppingListItem]) -> str:
     """Format a shopping list grouped by category with aligned columns.
 
@@ -101,10 +129,7 @@ def _format_shopping_list(items: list[ShoppingListItem]) -> str:
     regular: list[ShoppingListItem] = []
     restock: list[ShoppingListItem] = []
     for item in items:
-        if "restock" in item.from_meals:
-            restock.append(item)
-        else:
-            regular.append(item)
+        (restock if "restock" in item.from_meals else regular).append(item)
 
     lines: list[str] = []
     if regular:
@@ -127,21 +152,29 @@ def _format_items_by_category(items: list[ShoppingListItem]) -> str:
     Returns:
         Formatted string with category headers and aligned items.
     """
-    by_cat: dict[str, list[ShoppingListItem]] = {}
-    for item in items:
-        cat_key = str(item.category)
-        by_cat.setdefault(cat_key, []).append(item)
+    ordered = sorted(items, key=lambda x: (str(x.category), x.ingredient))
+    return "\n\n".join(
+        _format_category_block(cat_key, group)
+        for cat_key, group in itertools.groupby(ordered, key=lambda x: str(x.category))
+    )
 
-    lines: list[str] = []
-    for cat_key in sorted(by_cat.keys()):
-        display = _CATEGORY_DISPLAY.get(cat_key, cat_key.replace("_", " ").title())
-        lines.append(f"[{display}]")
-        for item in sorted(by_cat[cat_key], key=lambda x: x.ingredient):
-            qty = _format_quantity(item.quantity)
-            lines.append(f"  {qty} {item.unit:<8s} {item.ingredient}")
-        lines.append("")
 
-    return "\n".join(lines).rstrip()
+def _format_category_block(cat_key: str, items: Iterable[ShoppingListItem]) -> str:
+    """Format one category header and its items.
+
+    Args:
+        cat_key: Category value, e.g. ``"pantry_dry"``.
+        items: Items in that category, already in display order.
+
+    Returns:
+        Header line followed by one aligned line per item.
+    """
+    display = _category_display(cat_key)
+    rows = [
+        f"  {_format_quantity(item.quantity)} {item.unit:<8s} {item.ingredient}"
+        for item in items
+    ]
+    return "\n".join([f"[{display}]", *rows])
 
 
 def _format_quantity(qty: float) -> str:
@@ -155,7 +188,7 @@ def _format_quantity(qty: float) -> str:
     Returns:
         Formatted quantity string right-aligned in 6 chars.
     """
-    if qty == int(qty):
+    if qty.is_integer():
         return f"{int(qty):>6d}"
     return f"{qty:>6.1f}"
 
@@ -172,14 +205,23 @@ def _format_inventory(items: list[InventoryItem]) -> str:
     if not items:
         return "No tracked inventory items."
 
-    lines: list[str] = []
-    for item in items:
-        tag = f"[{item.status.value.upper()}]"
-        qty_str = ""
-        if item.current_quantity is not None and item.current_unit is not None:
-            qty_str = f"  ({item.current_quantity:g} {item.current_unit})"
-        lines.append(f"  {tag:<10s} {item.display_name}{qty_str}")
-    return "\n".join(lines)
+    return "\n".join([_format_inventory_line(item) for item in items])
+
+
+def _format_inventory_line(item: InventoryItem) -> str:
+    """Format one inventory item with its status tag and quantity.
+
+    Args:
+        item: Inventory item to format.
+
+    Returns:
+        Single indented display line.
+    """
+    tag = f"[{item.status.value.upper()}]"
+    qty_str = ""
+    if item.current_quantity is not None and item.current_unit is not None:
+        qty_str = f"  ({item.current_quantity:g} {item.current_unit})"
+    return f"  {tag:<10s} {item.display_name}{qty_str}"
 
 
 def _format_recipes(recipes: list[dict[str, object]]) -> str:
@@ -196,14 +238,43 @@ def _format_recipes(recipes: list[dict[str, object]]) -> str:
 
     header = f"  {'Name':<30s} {'Ordered':>8s}"
     sep = "  " + "-" * 40
-    lines: list[str] = [header, sep]
-    for recipe in recipes:
-        name = str(recipe.get("display_name", ""))
-        times = str(recipe.get("times_ordered", 0))
-        lines.append(f"  {name:<30s} {times:>8s}")
+    rows = [
+        f"  {recipe.get('display_name', '')!s:<30s}"
+        f" {recipe.get('times_ordered', 0)!s:>8s}"
+        for recipe in recipes
+    ]
+    return "\n".join([header, sep, *rows])
+
+
+def _format_recipe_detail(meal: ParsedMeal) -> str:
+    """Format one recipe with its purchase and pantry ingredients.
+
+    Args:
+        meal: Recipe to display.
+
+    Returns:
+        Multi-line recipe description, emitted with a single print.
+    """
+    lines = [f"Recipe: {meal.name} ({meal.servings} servings)", "Purchase items:"]
+    lines.extend(_format_ingredient_line(item) for item in meal.purchase_items)
+    lines.append("Pantry items:")
+    lines.extend(_format_ingredient_line(item) for item in meal.pantry_items)
     return "\n".join(lines)
 
 
+def _format_ingredient_line(item: Ingredient) -> str:
+    """Format one recipe ingredient as an indented line.
+
+    Args:
+        item: Ingredient to format.
+
+    Returns:
+        Line with quantity, unit and ingredient name.
+    """
+    qty = _format_quantity(item.quantity).strip()
+    return f"  {qty} {item.unit} {item.ingredient}"
+
+
 def _format_pantry_staples(staples: list[dict[str, object]]) -> str:
     """Format pantry staples as a table with name and category.
 
@@ -218,18 +289,20 @@ def _format_pantry_staples(staples: list[dict[str, object]]) -> str:
 
     header = f"  {'Name':<25s} {'Category':<15s}"
     sep = "  " + "-" * 42
-    lines: list[str] = [header, sep]
-    for staple in staples:
-        name = str(staple.get("display_name", ""))
-        cat = str(staple.get("category", ""))
-        lines.append(f"  {name:<25s} {cat:<15s}")
-    return "\n".join(lines)
+    rows = [
+        f"  {staple.get('display_name', '')!s:<25s} {staple.get('category', '')!s:<15s}"
+        for staple in staples
+    ]
+    return "\n".join([header, sep, *rows])
 
 
 # ------------------------------------------------------------------
 # Subcommand handlers
 # ------------------------------------------------------------------
 
+# Appended to errors from the Claude-backed plan steps.
+_API_KEY_HINT = "Hint: Check your API key and try again."
+
 
 def _handle_plan(args: argparse.Namespace) -> int:
     """Handle the ``plan`` subcommand.
@@ -240,6 +313,11 @@ def _handle_plan(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    from grocery_butler.consolidator import Consolidator
+    from grocery_butler.meal_parser import MealParser
+    from grocery_butler.pantry_manager import PantryManager
+    from grocery_butler.recipe_store import RecipeStore
+
     cfg = _load_config_safe()
     if cfg is None:
         print(
@@ -255,7 +333,7 @@ def _handle_plan(args: argparse.Namespace) -> int:
     parser = MealParser(store, anthropic_client=client, config=cfg)
     consolidator = Consolidator(anthropic_client=client, config=cfg)
 
-    meal_names = [m.strip() for m in args.meals.split(",") if m.strip()]
+    meal_names = _split_csv(args.meals)
     if not meal_names:
         print("Error: No meals specified.", file=sys.stderr)
         return 1
@@ -265,8 +343,10 @@ def _handle_plan(args: argparse.Namespace) -> int:
     try:
         parsed_meals = parser.parse_meals(meal_names, servings=servings)
     except Exception as exc:
-        print(f"Error parsing meals: {exc}", file=sys.stderr)
-        print("Hint: Check your API key and try again.", file=sys.stderr)
+        print(
+            f"Error parsing meals: {exc}\n{_API_KEY_HINT}",
+            file=sys.stderr,
+        )
         return 1
 
     if args.save:
@@ -275,8 +355,7 @@ def _handle_plan(args: argparse.Namespace) -> int:
                 parser.save_parsed_meal(meal)
                 print(f"Saved recipe: {meal.name}")
 
-    restock_queue = pantry_mgr.get_restock_queue()
-    pantry_staple_names = store.get_pantry_staple_names()
+    restock_queue, pantry_staple_names = pantry_mgr.get_restock_and_staples()
 
     try:
         shopping_list = consolidator.consolidate(
@@ -285,8 +364,10 @@ def _handle_plan(args: argparse.Namespace) -> int:
             pantry_staple_names,
         )
     except Exception as exc:
-        print(f"Error consolidating shopping list: {exc}", file=sys.stderr)
-        print("Hint: Check your API key and try again.", file=sys.stderr)
+        print(
+            f"Error consolidating shopping list: {exc}\n{_API_KEY_HINT}",
+            file=sys.stderr,
+        )
         return 1
 
     print(_format_shopping_list(shopping_list))
@@ -302,6 +383,9 @@ def _handle_stock(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    from grocery_butler.models import IngredientCategory, InventoryItem, InventoryStatus
+    from grocery_butler.pantry_manager import PantryManager
+
     cfg = _load_config_safe()
     db_path = cfg.database_path if cfg else "mealbot.db"
     pantry_mgr = PantryManager(db_path)
@@ -353,8 +437,8 @@ def _handle_stock(args: argparse.Namespace) -> int:
 
     pantry_mgr.update_status(item_name, new_status)
 
-    qty: float | None = getattr(args, "quantity", None)
-    unit: str | None = getattr(args, "unit", None)
+    qty: float | None = args.quantity
+    unit: str | None = args.unit
     if qty is not None and unit is not None:
         pantry_mgr.update_quantity(item_name, qty, unit)
         print(f"Updated '{item_name}' to {new_status.value} ({qty:g} {unit}).")
@@ -372,6 +456,8 @@ def _handle_restock(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    from grocery_butler.pantry_manager import PantryManager
+
     cfg = _load_config_safe()
     db_path = cfg.database_path if cfg else "mealbot.db"
     pantry_mgr = PantryManager(db_path)
@@ -402,6 +488,8 @@ def _handle_recipes(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    from grocery_butler.recipe_store import RecipeStore
+
     cfg = _load_config_safe()
     db_path = cfg.database_path if cfg else "mealbot.db"
     store = RecipeStore(db_path)
@@ -420,15 +508,7 @@ def _handle_recipes(args: argparse.Namespace) -> int:
         if meal is None:
             print(f"Recipe '{recipe_name}' not found.", file=sys.stderr)
             return 1
-        print(f"Recipe: {meal.name} ({meal.servings} servings)")
-        print("Purchase items:")
-        for item in meal.purchase_items:
-            qty = _format_quantity(item.quantity).strip()
-            print(f"  {qty} {item.unit} {item.ingredient}")
-        print("Pantry items:")
-        for item in meal.pantry_items:
-            qty = _format_quantity(item.quantity).strip()
-            print(f"  {qty} {item.unit} {item.ingredient}")
+        print(_format_recipe_detail(meal))
         return 0
 
     if action == "forget":
@@ -448,26 +528,22 @@ def _forget_recipe(store: RecipeStore, recipe_name: str) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
-    recipes = store.list_recipes()
     from grocery_butler.recipe_store import normalize_recipe_name
 
+    # Normalize each stored name once; the first recipe wins on collisions.
+    index: dict[str, dict[str, object]] = {}
+    for recipe in store.list_recipes():
+        index.setdefault(normalize_recipe_name(str(recipe["display_name"])), recipe)
+
     normalized = normalize_recipe_name(recipe_name)
-    for recipe in recipes:
-        if normalize_recipe_name(str(recipe["display_name"])) == normalized:
-            recipe_id = recipe.get("id")
-            if recipe_id is not None:
-                store.delete_recipe(int(str(recipe_id)))
-                print(f"Deleted recipe '{recipe['display_name']}'.")
-                return 0
-    # Try substring match
-    for recipe in recipes:
-        name_norm = normalize_recipe_name(str(recipe["display_name"]))
-        if normalized in name_norm:
-            recipe_id = recipe.get("id")
-            if recipe_id is not None:
-                store.delete_recipe(int(str(recipe_id)))
-                print(f"Deleted recipe '{recipe['display_name']}'.")
-                return 0
+    match = index.get(normalized)
+    if match is None:
+        # Try substring match
+        match = next((r for key, r in index.items() if normalized in key), None)
+    if match is not None and match.get("id") is not None:
+        store.delete_recipe(int(str(match["id"])))
+        print(f"Deleted recipe '{match['display_name']}'.")
+        return 0
     print(f"Recipe '{recipe_name}' not found.", file=sys.stderr)
     return 1
 
@@ -481,6 +557,9 @@ def _handle_pantry(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    from grocery_butler.models import IngredientCategory
+    from grocery_butler.recipe_store import RecipeStore
+
     cfg = _load_config_safe()
     db_path = cfg.database_path if cfg else "mealbot.db"
     store = RecipeStore(db_path)
@@ -611,6 +690,10 @@ def _handle_order(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    from grocery_butler.pantry_manager import PantryManager
+    from grocery_butler.recipe_store import RecipeStore
+    from grocery_butler.safeway_pipeline import SafewayPipeline, SafewayPipelineError
+
     cfg = _load_config_safe()
     if cfg is None:
         print(
@@ -621,18 +704,26 @@ def _handle_order(args: argparse.Namespace) -> int:
         return 1
 
     client = _make_anthropic_client(cfg.anthropic_api_key)
+    store = RecipeStore(cfg.database_path)
+    pantry_mgr = PantryManager(cfg.database_path, anthropic_client=client)
 
     try:
-        pipeline = SafewayPipeline(cfg, cfg.database_path, client)
+        pipeline = SafewayPipeline(
+            cfg,
+            cfg.database_path,
+            client,
+            recipe_store=store,
+            pantry_manager=pantry_mgr,
+        )
     except SafewayPipelineError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
-    items = _parse_order_items(args, cfg)
+    items = _parse_order_items(args, cfg, client, store, pantry_mgr)
     if items is None:
         return 1
 
-    dry_run: bool = getattr(args, "dry_run", False)
+    dry_run: bool = args.dry_run
 
     try:
         if dry_run:
@@ -664,24 +755,30 @@ def _handle_order(args: argparse.Namespace) -> int:
 def _parse_order_items(
     args: argparse.Namespace,
     cfg: Config,
+    client: object | None,
+    store: RecipeStore,
+    pantry_mgr: PantryManager,
 ) -> list[ShoppingListItem] | None:
     """Parse order items from CLI arguments.
 
     Args:
         args: Parsed arguments with items or meals.
         cfg: Application configuration.
+        client: Anthropic client (or None) for meal parsing.
+        store: Recipe store shared with the order pipeline.
+        pantry_mgr: Pantry manager shared with the order pipeline.
 
     Returns:
         List of ShoppingListItem or None on error.
     """
-    items_str: str | None = getattr(args, "items", None)
-    meals_str: str | None = getattr(args, "meals", None)
+    items_str: str | None = args.items
+    meals_str: str | None = args.meals
 
     if items_str:
         return _items_from_string(items_str)
 
     if meals_str:
-        return _items_from_meals(meals_str, cfg)
+        return _items_from_meals(meals_str, cfg, client, store, pantry_mgr)
 
     print(
         "Error: Provide --items or --meals.",
@@ -706,27 +803,35 @@ def _items_from_string(items_str: str) -> list[ShoppingListItem]:
     return items_from_string(items_str)
 
 
-def _items_from_meals(meals_str: str, cfg: Config) -> list[ShoppingListItem]:
+def _items_from_meals(
+    meals_str: str,
+    cfg: Config,
+    client: object | None,
+    store: RecipeStore,
+    pantry_mgr: PantryManager,
+) -> list[ShoppingListItem]:
     """Parse meals and consolidate into shopping list items.
 
     Args:
         meals_str: Comma-separated meal names.
         cfg: Application config.
+        client: Anthropic client (or None) shared with the order pipeline.
+        store: Recipe store shared with the order pipeline.
+        pantry_mgr: Pantry manager shared with the order pipeline.
 
     Returns:
         Consolidated shopping list items.
     """
-    client = _make_anthropic_client(cfg.anthropic_api_key)
-    store = RecipeStore(cfg.database_path)
+    from grocery_butler.consolidator import Consolidator
+    from grocery_butler.meal_parser import MealParser
+
     parser = MealParser(store, anthropic_client=client, config=cfg)
     consolidator = Consolidator(anthropic_client=client, config=cfg)
 
-    meal_names = [m.strip() for m in meals_str.split(",") if m.strip()]
+    meal_names = _split_csv(meals_str)
     parsed_meals = parser.parse_meals(meal_names)
 
-    pantry_mgr = PantryManager(cfg.database_path, anthropic_client=client)
-    restock_queue = pantry_mgr.get_restock_queue()
-    pantry_staple_names = store.get_pantry_staple_names()
+    restock_queue, pantry_staple_names = pantry_mgr.get_restock_and_staples()
 
     return consolidator.consolidate(parsed_meals, restock_queue, pantry_staple_names)
 
@@ -761,8 +866,12 @@ def _handle_bot() -> int:
 # ------------------------------------------------------------------
 
 
-def _build_parser() -> argparse.ArgumentParser:
-    """Build the CLI argument parser with all subcommands.
+def _build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI argument parser.
+
+    Args:
+        only: If a known subcommand name, register just that subcommand;
+            otherwise register all of them.
 
     Returns:
         Configured ArgumentParser instance.
@@ -773,13 +882,12 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     subparsers = parser.add_subparsers(dest="command")
 
-    _add_plan_parser(subparsers)
-    _add_order_parser(subparsers)
-    _add_stock_parser(subparsers)
-    _add_restock_parser(subparsers)
-    _add_recipes_parser(subparsers)
-    _add_pantry_parser(subparsers)
-    _add_bot_parser(subparsers)
+    add_one = _SUBPARSER_BUILDERS.get(only) if only is not None else None
+    if add_one is not None:
+        add_one(subparsers)
+    else:
+        for add_subparser in _SUBPARSER_BUILDERS.values():
+            add_subparser(subparsers)
 
     return parser
 
@@ -982,6 +1090,21 @@ def _add_pantry_parser(
     )
 
 
+# Subcommand name -> function registering its subparser, in help order.
+_SUBPARSER_BUILDERS: dict[
+    str,
+    Callable[[argparse._SubParsersAction[argparse.ArgumentParser]], None],
+] = {
+    "plan": _add_plan_parser,
+    "order": _add_order_parser,
+    "stock": _add_stock_parser,
+    "restock": _add_restock_parser,
+    "recipes": _add_recipes_parser,
+    "pantry": _add_pantry_parser,
+    "bot": _add_bot_parser,
+}
+
+
 # ------------------------------------------------------------------
 # Entry point
 # ------------------------------------------------------------------
@@ -993,7 +1116,11 @@ def main(argv: list[str] | None = None) -> None:
     Args:
         argv: Optional argument list (defaults to sys.argv[1:]).
     """
-    parser = _build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    # Only the chosen subcommand's parser is needed; anything else
+    # (no args, --help, a typo) gets the full parser for help/errors.
+    parser = _build_parser(argv[0] if argv else None)
     args = parser.parse_args(argv)
 
     if args.command is None:
@@ -1004,6 +1131,18 @@ def main(argv: list[str] | None = None) -> None:
     sys.exit(exit_code)
 
 
+# Subcommand name -> handler returning an exit code.
+_HANDLERS: dict[str, Callable[[argparse.Namespace], int]] = {
+    "plan": _handle_plan,
+    "order": _handle_order,
+    "stock": _handle_stock,
+    "restock": _handle_restock,
+    "recipes": _handle_recipes,
+    "pantry": _handle_pantry,
+    "bot": lambda _args: _handle_bot(),
+}
+
+
 def _dispatch(args: argparse.Namespace) -> int:
     """Dispatch a parsed command to the appropriate handler.
 
@@ -1011,21 +1150,9 @@ def _dispatch(args: argparse.Namespace) -> int:
         args: Parsed command-line arguments.
 
     Returns:
-        Exit code from the handler.
+        Exit code from the handler, or 1 for an unknown command.
     """
-    command: str = args.command
-    if command == "plan":
-        return _handle_plan(args)
-    if command == "order":
-        return _handle_order(args)
-    if command == "stock":
-        return _handle_stock(args)
-    if command == "restock":
-        return _handle_restock(args)
-    if command == "recipes":
-        return _handle_recipes(args)
-    if command == "pantry":
-        return _handle_pantry(args)
-    if command == "bot":
-        return _handle_bot()
-    return 1  # pragma: no cover
+    handler = _HANDLERS.get(args.command)
+    if handler is None:
+        return 1  # pragma: no cover
+    return handler(args)
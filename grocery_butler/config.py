@@ -38,6 +38,9 @@ class Config:
     flask_port: int = 5000
     flask_debug: bool = False
 
+    # Worker threads for the bot's blocking DB/API calls
+    thread_pool_size: int = 64
+
     # Meal planning defaults
     default_servings: int = 4
     default_units: str = "imperial"  # "imperial" or "metric"
@@ -48,6 +51,26 @@ class Config:
     safeway_store_id: str = ""
 
 
+# (Config attribute, environment variable, default) for plain string
+# settings, read verbatim.
+_STR_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("discord_bot_token", "DISCORD_BOT_TOKEN", ""),
+    ("database_path", "DATABASE_PATH", "mealbot.db"),
+    ("database_url", "DATABASE_URL", ""),
+    ("default_units", "DEFAULT_UNITS", "imperial"),
+    ("safeway_username", "SAFEWAY_USERNAME", ""),
+    ("safeway_password", "SAFEWAY_PASSWORD", ""),
+    ("safeway_store_id", "SAFEWAY_STORE_ID", ""),
+)
+
+# Integer settings, parsed by _env_int in this order.
+_INT_FIELDS: tuple[tuple[str, str, int], ...] = (
+    ("flask_port", "FLASK_PORT", 5000),
+    ("default_servings", "DEFAULT_SERVINGS", 4),
+    ("thread_pool_size", "THREAD_POOL_SIZE", 64),
+)
+
+
 def load_config(env_path: str | Path | None = None) -> Config:
     """Load and validate configuration from environment / .env file.
 
@@ -69,34 +92,52 @@ def load_config(env_path: str | Path | None = None) -> Config:
             "Copy .env.example to .env and fill in your key."
         )
 
-    flask_port_raw = os.getenv("FLASK_PORT", "5000")
-    try:
-        flask_port = int(flask_port_raw)
-    except ValueError as err:
-        raise ConfigError(
-            f"FLASK_PORT must be an integer, got: {flask_port_raw!r}"
-        ) from err
-
-    default_servings_raw = os.getenv("DEFAULT_SERVINGS", "4")
-    try:
-        default_servings = int(default_servings_raw)
-    except ValueError as err:
+    ints: dict[str, int] = {
+        attr: _env_int(env_name, default) for attr, env_name, default in _INT_FIELDS
+    }
+    thread_pool_size = ints["thread_pool_size"]
+    if thread_pool_size < 1:
         raise ConfigError(
-            f"DEFAULT_SERVINGS must be an integer, got: {default_servings_raw!r}"
-        ) from err
-
-    database_url = os.getenv("DATABASE_URL", "")
+            f"THREAD_POOL_SIZE must be at least 1, got: {thread_pool_size}"
+        )
+    strs: dict[str, str] = {
+        attr: os.getenv(env_name, default) for attr, env_name, default in _STR_FIELDS
+    }
 
+    # Explicit keywords keep Config's field names and types checked by mypy.
     return Config(
         anthropic_api_key=anthropic_api_key,
-        discord_bot_token=os.getenv("DISCORD_BOT_TOKEN", ""),
-        database_path=os.getenv("DATABASE_PATH", "mealbot.db"),
-        database_url=database_url,
-        flask_port=flask_port,
+        discord_bot_token=strs["discord_bot_token"],
+        database_path=strs["database_path"],
+        database_url=strs["database_url"],
+        flask_port=ints["flask_port"],
         flask_debug=os.getenv("FLASK_DEBUG", "false").lower() in ("true", "1", "yes"),
-        default_servings=default_servings,
-        default_units=os.getenv("DEFAULT_UNITS", "imperial"),
-        safeway_username=os.getenv("SAFEWAY_USERNAME", ""),
-        safeway_password=os.getenv("SAFEWAY_PASSWORD", ""),
-        safeway_store_id=os.getenv("SAFEWAY_STORE_ID", ""),
+        thread_pool_size=thread_pool_size,
+        default_servings=ints["default_servings"],
+        default_units=strs["default_units"],
+        safeway_username=strs["safeway_username"],
+        safeway_password=strs["safeway_password"],
+        safeway_store_id=strs["safeway_store_id"],
     )
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable.
+
+    Args:
+        name: Environment variable name.
+        default: Value used when the variable is unset.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        ConfigError: If the variable is set but not an integer.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError as err:
+        raise ConfigError(f"{name} must be an integer, got: {raw!r}") from err
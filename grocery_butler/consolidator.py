@@ -9,9 +9,10 @@ from __future__ import annotations
 
 import json
 import logging
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-from grocery_butler.claude_utils import extract_json_text
+from grocery_butler.claude_utils import parse_claude_json
 from grocery_butler.models import IngredientCategory, ShoppingListItem, Unit, parse_unit
 from grocery_butler.prompt_loader import load_prompt
 
@@ -21,6 +22,37 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Inventory statuses that put an item on the shopping list.
+_RESTOCK_STATUSES: frozenset[str] = frozenset({"low", "out"})
+
+# Category lookup by value; unknown strings fall back to OTHER with a
+# dict miss instead of a raised and caught ValueError.
+_CATEGORY_BY_VALUE: dict[str, IngredientCategory] = {
+    category.value: category for category in IngredientCategory
+}
+
+
+@dataclass
+class _MergedIngredient:
+    """Running totals for one ingredient during simple consolidation.
+
+    Attributes:
+        ingredient: Ingredient name as first seen.
+        quantity: Summed quantity across meals.
+        unit: Unit of the first occurrence.
+        category: Category of the first occurrence.
+        from_meals: Names of meals needing this ingredient, in order.
+        seen_meals: Set view of ``from_meals`` for constant-time
+            duplicate checks when an ingredient recurs across many meals.
+    """
+
+    ingredient: str
+    quantity: float
+    unit: Unit
+    category: IngredientCategory
+    from_meals: list[str]
+    seen_meals: set[str] = field(default_factory=set)
+
 
 def _format_pantry_staples(pantry_staples: list[str]) -> str:
     """Format pantry staples list for the prompt template.
@@ -47,17 +79,27 @@ def _format_restock_queue(restock_queue: list[InventoryItem]) -> str:
     Returns:
         Formatted string for prompt insertion.
     """
-    entries: list[str] = []
-    for item in restock_queue:
-        if item.status not in ("low", "out"):
-            continue
-        parts = [f"- {item.display_name} (status: {item.status})"]
-        if item.default_quantity is not None and item.default_unit is not None:
-            parts.append(f"  qty: {item.default_quantity} {item.default_unit}")
-        entries.append(" ".join(parts))
-    if not entries:
-        return "None"
-    return "\n".join(entries)
+    entries = [
+        _format_restock_entry(item)
+        for item in restock_queue
+        if item.status in _RESTOCK_STATUSES
+    ]
+    return "\n".join(entries) if entries else "None"
+
+
+def _format_restock_entry(item: InventoryItem) -> str:
+    """Format one restock queue item as a single prompt line.
+
+    Args:
+        item: Inventory item with status 'low' or 'out'.
+
+    Returns:
+        Bullet line with status and, when known, the default quantity.
+    """
+    line = f"- {item.display_name} (status: {item.status})"
+    if item.default_quantity is not None and item.default_unit is not None:
+        return f"{line}   qty: {item.default_quantity} {item.default_unit}"
+    return line
 
 
 def _format_inventory_overrides(inventory_overrides: list[str] | None) -> str:
@@ -98,11 +140,9 @@ def _parse_shopping_item(data: dict[str, object]) -> ShoppingListItem:
         [str(m) for m in raw_from_meals] if isinstance(raw_from_meals, list) else []
     )
 
-    raw_category = str(data.get("category", "other"))
-    try:
-        category = IngredientCategory(raw_category)
-    except ValueError:
-        category = IngredientCategory.OTHER
+    category = _CATEGORY_BY_VALUE.get(
+        str(data.get("category", "other")), IngredientCategory.OTHER
+    )
 
     return ShoppingListItem(
         ingredient=str(data.get("ingredient", "")),
@@ -125,8 +165,7 @@ def _parse_response_items(response_text: str) -> list[ShoppingListItem] | None:
         List of ShoppingListItem or None if parsing fails.
     """
     try:
-        cleaned = extract_json_text(response_text)
-        data = json.loads(cleaned)
+        data = parse_claude_json(response_text)
     except (json.JSONDecodeError, ValueError):
         logger.warning("Failed to parse consolidation response")
         return None
@@ -137,34 +176,6 @@ def _parse_response_items(response_text: str) -> list[ShoppingListItem] | None:
     return [_parse_shopping_item(item) for item in data if isinstance(item, dict)]
 
 
-def _flatten_meal_ingredients(
-    meals: list[ParsedMeal],
-) -> list[tuple[str, float, str, str, str]]:
-    """Flatten all purchase items from meals into a list of tuples.
-
-    Each tuple contains (ingredient, quantity, unit, category, meal_name).
-
-    Args:
-        meals: List of parsed meals.
-
-    Returns:
-        List of (ingredient, quantity, unit, category, meal_name) tuples.
-    """
-    result: list[tuple[str, float, str, str, str]] = []
-    for meal in meals:
-        for item in meal.purchase_items:
-            result.append(
-                (
-                    item.ingredient,
-                    item.quantity,
-                    item.unit,
-                    str(item.category),
-                    meal.name,
-                )
-            )
-    return result
-
-
 def _build_ingredient_text(
     meals: list[ParsedMeal],
 ) -> str:
@@ -239,7 +250,11 @@ class Consolidator:
         Returns:
             Consolidated shopping list.
         """
-        if self._client is None:
+        # With no meal ingredients and no overrides there is nothing for
+        # Claude to merge: the result is just the restock items.
+        if self._client is None or not (
+            inventory_overrides or any(meal.purchase_items for meal in meals)
+        ):
             return self.consolidate_simple(
                 meals,
                 restock_queue,
@@ -312,7 +327,7 @@ class Consolidator:
     def _merge_meal_ingredients(
         meals: list[ParsedMeal],
         pantry_lower: set[str],
-    ) -> dict[str, dict[str, object]]:
+    ) -> dict[str, _MergedIngredient]:
         """Merge ingredient quantities across meals, excluding pantry staples.
 
         Args:
@@ -320,41 +335,34 @@ class Consolidator:
             pantry_lower: Lowercased pantry staple names to exclude.
 
         Returns:
-            Dict keyed by ingredient name with merged data.
+            Dict keyed by lowercased ingredient name with merged data.
         """
-        merged: dict[str, dict[str, object]] = {}
+        merged: dict[str, _MergedIngredient] = {}
         for meal in meals:
             for item in meal.purchase_items:
                 key = item.ingredient.lower()
                 if key in pantry_lower:
                     continue
-                if key in merged:
-                    entry = merged[key]
-                    raw_qty = entry.get("quantity", 0.0)
-                    current_qty = (
-                        float(raw_qty) if isinstance(raw_qty, (int, float)) else 0.0
-                    )
-                    entry["quantity"] = current_qty + item.quantity
-                    raw_meals = entry.get("from_meals", [])
-                    from_meals_list: list[str] = (
-                        list(raw_meals) if isinstance(raw_meals, list) else []
+                entry = merged.get(key)
+                if entry is None:
+                    merged[key] = _MergedIngredient(
+                        ingredient=item.ingredient,
+                        quantity=item.quantity,
+                        unit=item.unit,
+                        category=item.category,
+                        from_meals=[meal.name],
+                        seen_meals={meal.name},
                     )
-                    if meal.name not in from_meals_list:
-                        from_meals_list.append(meal.name)
-                    entry["from_meals"] = from_meals_list
-                else:
-                    merged[key] = {
-                        "ingredient": item.ingredient,
-                        "quantity": item.quantity,
-                        "unit": item.unit,
-                        "category": str(item.category),
-                        "from_meals": [meal.name],
-                    }
+                    continue
+                entry.quantity += item.quantity
+                if meal.name not in entry.seen_meals:
+                    entry.seen_meals.add(meal.name)
+                    entry.from_meals.append(meal.name)
         return merged
 
     @staticmethod
     def _build_items_from_merged(
-        merged: dict[str, dict[str, object]],
+        merged: dict[str, _MergedIngredient],
     ) -> list[ShoppingListItem]:
         """Convert merged ingredient dict into ShoppingListItem list.
 
@@ -364,32 +372,18 @@ class Consolidator:
         Returns:
             List of ShoppingListItem instances.
         """
-        result: list[ShoppingListItem] = []
-        for entry in merged.values():
-            raw_qty = entry.get("quantity", 0.0)
-            quantity = float(raw_qty) if isinstance(raw_qty, (int, float)) else 0.0
-            raw_from = entry.get("from_meals", [])
-            from_meals: list[str] = (
-                [str(m) for m in raw_from] if isinstance(raw_from, list) else []
+        return [
+            ShoppingListItem(
+                ingredient=entry.ingredient,
+                quantity=entry.quantity,
+                unit=entry.unit,
+                category=entry.category,
+                search_term=entry.ingredient,
+                from_meals=entry.from_meals,
+                estimated_price=None,
             )
-            raw_category = str(entry.get("category", "other"))
-            try:
-                category = IngredientCategory(raw_category)
-            except ValueError:
-                category = IngredientCategory.OTHER
-            ingredient_name = str(entry.get("ingredient", ""))
-            result.append(
-                ShoppingListItem(
-                    ingredient=ingredient_name,
-                    quantity=quantity,
-                    unit=parse_unit(str(entry.get("unit", ""))),
-                    category=category,
-                    search_term=ingredient_name,
-                    from_meals=from_meals,
-                    estimated_price=None,
-                )
-            )
-        return result
+            for entry in merged.values()
+        ]
 
     @staticmethod
     def _build_restock_items(
@@ -407,7 +401,7 @@ class Consolidator:
         """
         items: list[ShoppingListItem] = []
         for inv in restock_queue:
-            if inv.status not in ("low", "out"):
+            if inv.status not in _RESTOCK_STATUSES:
                 continue
             items.append(
                 ShoppingListItem(
@@ -479,7 +473,8 @@ class Consolidator:
                 max_tokens=4096,
                 messages=[{"role": "user", "content": prompt}],
             )
-            return str(response.content[0].text)
+            text: str = response.content[0].text
+            return text
         except Exception:
             logger.exception("Claude API call failed")
             return None
@@ -515,7 +510,8 @@ class Consolidator:
                     },
                 ],
             )
-            return str(response.content[0].text)
+            text: str = response.content[0].text
+            return text
         except Exception:
             logger.exception("Claude retry call failed")
             return None
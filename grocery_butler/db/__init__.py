@@ -73,3 +73,17 @@ def init_db(db_path: str) -> None:
     from grocery_butler.db.migrate import migrate
 
     migrate(db_path)
+
+
+def reset_memory_db() -> None:
+    """Discard the shared ``:memory:`` database.
+
+    Closes the keepalive connection opened by :func:`init_db`, so the
+    next ``init_db(":memory:")`` starts from an empty database and
+    re-applies every migration. Intended for tests that need a clean
+    in-memory state; a no-op when no in-memory database is open.
+    """
+    global _memory_keepalive
+    if _memory_keepalive is not None:
+        _memory_keepalive.close()
+        _memory_keepalive = None
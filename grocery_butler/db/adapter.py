@@ -120,7 +120,8 @@ class DatabaseConnection(Protocol):
     """Protocol for database connection objects.
 
     Wraps engine-specific connections behind a common interface
-    supporting ``execute``, ``executescript``, ``commit``, and ``close``.
+    supporting ``execute``, ``executemany``, ``executescript``, ``commit``,
+    and ``close``.
     """
 
     def execute(self, sql: str, params: Sequence[Any] = ()) -> CursorResult:
@@ -138,6 +139,21 @@ class DatabaseConnection(Protocol):
         """
         ...  # pragma: no cover
 
+    def executemany(self, sql: str, seq_of_params: Sequence[Sequence[Any]]) -> int:
+        """Execute one SQL statement for each parameter tuple.
+
+        The statement is prepared once and re-bound per tuple, which is
+        much cheaper than calling :meth:`execute` in a loop for bulk DML.
+
+        Args:
+            sql: SQL statement with ``?`` placeholders.
+            seq_of_params: One parameter sequence per execution.
+
+        Returns:
+            Total number of rows affected across all executions.
+        """
+        ...  # pragma: no cover
+
     def executescript(self, sql: str) -> None:
         """Execute multiple SQL statements separated by semicolons.
 
@@ -245,6 +261,19 @@ class SQLiteConnection:
         cursor = self._conn.execute(sql, params)
         return SQLiteCursorResult(cursor)
 
+    def executemany(self, sql: str, seq_of_params: Sequence[Sequence[Any]]) -> int:
+        """Execute a statement once per parameter tuple.
+
+        Args:
+            sql: SQL string with ``?`` parameter placeholders.
+            seq_of_params: One parameter sequence per execution.
+
+        Returns:
+            Total number of rows affected.
+        """
+        rowcount: int = self._conn.executemany(sql, seq_of_params).rowcount
+        return rowcount
+
     def executescript(self, sql: str) -> None:
         """Execute a multi-statement SQL script.
 
@@ -271,7 +300,9 @@ def _create_sqlite_connection(db_path: str) -> SQLiteConnection:
     """Create a configured SQLite connection.
 
     Enables WAL journal mode, foreign key enforcement, and sets
-    the row factory to ``sqlite3.Row`` for dict-like access.
+    the row factory to ``sqlite3.Row`` for dict-like access. Both
+    PRAGMAs go to SQLite in one script; WAL is skipped for in-memory
+    databases, which cannot use it.
 
     Args:
         db_path: File path, or ``:memory:`` for in-memory databases.
@@ -281,10 +312,10 @@ def _create_sqlite_connection(db_path: str) -> SQLiteConnection:
     """
     if db_path == ":memory:":
         raw = sqlite3.connect("file::memory:?cache=shared", uri=True)
+        raw.execute("PRAGMA foreign_keys=ON")
     else:
         raw = sqlite3.connect(db_path)
-    raw.execute("PRAGMA journal_mode=WAL")
-    raw.execute("PRAGMA foreign_keys=ON")
+        raw.executescript("PRAGMA journal_mode=WAL; PRAGMA foreign_keys=ON;")
     raw.row_factory = sqlite3.Row
     return SQLiteConnection(raw)
 
@@ -506,6 +537,24 @@ class PostgresConnection:
         cursor.execute(translated, params or None)
         return PostgresCursorResult(cursor, returning_injected)
 
+    def executemany(self, sql: str, seq_of_params: Sequence[Sequence[Any]]) -> int:
+        """Execute a statement once per parameter tuple.
+
+        Converts ``?`` -> ``%s``. No ``RETURNING`` clause is injected,
+        since per-row ids are not reported for batched statements.
+
+        Args:
+            sql: SQL string with ``?`` parameter placeholders.
+            seq_of_params: One parameter sequence per execution.
+
+        Returns:
+            Total number of rows affected.
+        """
+        with self._conn.cursor() as cursor:
+            cursor.executemany(_translate_placeholders(sql.strip()), seq_of_params)
+            rowcount: int = cursor.rowcount
+        return rowcount
+
     def executescript(self, sql: str) -> None:
         """Execute a multi-statement SQL script.
 
@@ -16,6 +16,7 @@ Usage::
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import os
 import re
@@ -78,17 +79,21 @@ def _get_applied_versions(conn: DatabaseConnection) -> set[int]:
     return {row["version"] for row in cursor.fetchall()}
 
 
-def _discover_migrations(is_pg: bool) -> list[tuple[int, str, Path]]:
+@functools.lru_cache(maxsize=2)
+def _discover_migrations(is_pg: bool) -> tuple[tuple[int, str, Path], ...]:
     """Scan the migrations directory for SQL files matching the dialect.
 
     Files are named ``NNN_name.sql`` (SQLite) or ``NNN_name_pg.sql``
     (PostgreSQL).  Only files matching the requested dialect are returned.
+    The migration files ship with the package, so the directory is
+    scanned once per dialect per process; every store constructor runs
+    :func:`migrate` and would otherwise list it again.
 
     Args:
         is_pg: Whether to select PostgreSQL dialect files.
 
     Returns:
-        Sorted list of ``(version, name, path)`` tuples.
+        Sorted ``(version, name, path)`` tuples.
     """
     results: list[tuple[int, str, Path]] = []
 
@@ -110,7 +115,7 @@ def _discover_migrations(is_pg: bool) -> list[tuple[int, str, Path]]:
             results.append((version, name, path))
 
     results.sort(key=lambda t: t[0])
-    return results
+    return tuple(results)
 
 
 def _record_migration(conn: DatabaseConnection, version: int, name: str) -> None:
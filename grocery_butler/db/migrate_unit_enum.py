@@ -18,92 +18,151 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from collections import defaultdict
+from typing import TYPE_CHECKING
 
 from grocery_butler.db import get_connection
-from grocery_butler.models import parse_unit
+from grocery_butler.models import Unit, parse_unit
+
+if TYPE_CHECKING:
+    from grocery_butler.db.adapter import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
+# Canonical unit values. Rows already holding one of these are left out
+# of the SELECT, so re-runs on a migrated database read nothing back.
+_VALID_UNITS: tuple[str, ...] = tuple(unit.value for unit in Unit)
+_VALID_UNITS_SQL = ", ".join("?" * len(_VALID_UNITS))
+
+# Ids bound per ``WHERE id IN (...)`` UPDATE; well under SQLite's
+# host-parameter limit on every supported version.
+_UPDATE_CHUNK_SIZE = 500
+
+
+def _apply_unit_updates(
+    conn: DatabaseConnection,
+    update_sql: str,
+    ids_by_unit: dict[str, list[int]],
+) -> int:
+    """Write normalized units with one ``IN`` UPDATE per unit and chunk.
+
+    Dirty rows collapse onto a few dozen canonical units, so grouping
+    by target value issues far fewer statements than one per row.
+
+    Args:
+        conn: Open database connection.
+        update_sql: UPDATE with a ``?`` for the unit and an ``{ids}``
+            slot for the id placeholders.
+        ids_by_unit: Row ids to rewrite, keyed by normalized unit.
+
+    Returns:
+        Number of rows updated.
+    """
+    total = 0
+    for unit, ids in ids_by_unit.items():
+        for start in range(0, len(ids), _UPDATE_CHUNK_SIZE):
+            chunk = ids[start : start + _UPDATE_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            conn.execute(update_sql.format(ids=placeholders), (unit, *chunk))
+        total += len(ids)
+    return total
+
 
-def _migrate_recipe_ingredients(db_path: str) -> int:
+def _migrate_recipe_ingredients(conn: DatabaseConnection) -> int:
     """Normalize unit values in the recipe_ingredients table.
 
+    Does not commit; the caller owns the transaction. Rows are read one
+    at a time, so only the pending ids are held in memory, never the
+    table itself.
+
     Args:
-        db_path: Path to the SQLite database file.
+        conn: Open database connection.
 
     Returns:
         Number of rows updated.
     """
-    conn = get_connection(db_path)
-    updated = 0
-    try:
-        rows = conn.execute("SELECT id, unit FROM recipe_ingredients").fetchall()
-        for row in rows:
-            row_id: int = row["id"]
-            raw_unit: str = row["unit"]
-            normalized = parse_unit(raw_unit).value
-            if normalized != raw_unit:
-                conn.execute(
-                    "UPDATE recipe_ingredients SET unit = ? WHERE id = ?",
-                    (normalized, row_id),
-                )
-                updated += 1
-                logger.debug(
-                    "recipe_ingredients id=%d: %r -> %r", row_id, raw_unit, normalized
-                )
-        conn.commit()
-    finally:
-        conn.close()
-    return updated
+    ids_by_unit: defaultdict[str, list[int]] = defaultdict(list)
+    cursor = conn.execute(
+        "SELECT id, unit FROM recipe_ingredients "
+        f"WHERE unit NOT IN ({_VALID_UNITS_SQL})",
+        _VALID_UNITS,
+    )
+    while (row := cursor.fetchone()) is not None:
+        row_id: int = row["id"]
+        raw_unit: str = row["unit"]
+        normalized = parse_unit(raw_unit).value
+        if normalized != raw_unit:
+            ids_by_unit[normalized].append(row_id)
+            logger.debug(
+                "recipe_ingredients id=%d: %r -> %r", row_id, raw_unit, normalized
+            )
+    return _apply_unit_updates(
+        conn,
+        "UPDATE recipe_ingredients SET unit = ? WHERE id IN ({ids})",
+        ids_by_unit,
+    )
 
 
-def _migrate_household_inventory(db_path: str) -> int:
+def _migrate_household_inventory(conn: DatabaseConnection) -> int:
     """Normalize default_unit values in the household_inventory table.
 
+    Does not commit; the caller owns the transaction. Rows are read one
+    at a time, as in :func:`_migrate_recipe_ingredients`. NULL
+    default_unit rows (no default) never match ``NOT IN`` and are left
+    as they are.
+
     Args:
-        db_path: Path to the SQLite database file.
+        conn: Open database connection.
 
     Returns:
         Number of rows updated.
     """
-    conn = get_connection(db_path)
-    updated = 0
-    try:
-        rows = conn.execute(
-            "SELECT id, default_unit FROM household_inventory"
-        ).fetchall()
-        for row in rows:
-            row_id: int = row["id"]
-            raw_unit: str | None = row["default_unit"]
-            if raw_unit is None:
-                continue
-            normalized = parse_unit(raw_unit).value
-            if normalized != raw_unit:
-                conn.execute(
-                    "UPDATE household_inventory SET default_unit = ? WHERE id = ?",
-                    (normalized, row_id),
-                )
-                updated += 1
-                logger.debug(
-                    "household_inventory id=%d: %r -> %r",
-                    row_id,
-                    raw_unit,
-                    normalized,
-                )
-        conn.commit()
-    finally:
-        conn.close()
-    return updated
+    ids_by_unit: defaultdict[str, list[int]] = defaultdict(list)
+    cursor = conn.execute(
+        "SELECT id, default_unit FROM household_inventory "
+        f"WHERE default_unit NOT IN ({_VALID_UNITS_SQL})",
+        _VALID_UNITS,
+    )
+    while (row := cursor.fetchone()) is not None:
+        row_id: int = row["id"]
+        raw_unit: str = row["default_unit"]
+        normalized = parse_unit(raw_unit).value
+        if normalized != raw_unit:
+            ids_by_unit[normalized].append(row_id)
+            logger.debug(
+                "household_inventory id=%d: %r -> %r",
+                row_id,
+                raw_unit,
+                normalized,
+            )
+    return _apply_unit_updates(
+        conn,
+        "UPDATE household_inventory SET default_unit = ? WHERE id IN ({ids})",
+        ids_by_unit,
+    )
 
 
 def migrate(db_path: str) -> None:
     """Run all unit-enum migrations against the given database.
 
+    Both tables are rewritten on one connection and committed together,
+    so the data is either fully normalized or, if anything fails,
+    untouched (closing without a commit discards the transaction).
+
     Args:
         db_path: Path to the SQLite database file.
     """
-    ri_count = _migrate_recipe_ingredients(db_path)
-    hi_count = _migrate_household_inventory(db_path)
+    conn = get_connection(db_path)
+    try:
+        # Connections are already in WAL mode, where NORMAL sync skips
+        # the per-commit fsync yet stays durable across app crashes.
+        # Per-connection only; PostgreSQL ignores it.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        ri_count = _migrate_recipe_ingredients(conn)
+        hi_count = _migrate_household_inventory(conn)
+        conn.commit()
+    finally:
+        conn.close()
     logger.info(
         "Migration complete: %d recipe_ingredients row(s) updated, "
         "%d household_inventory row(s) updated.",
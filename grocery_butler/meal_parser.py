@@ -9,9 +9,11 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from grocery_butler.claude_utils import extract_json_text
+from grocery_butler.claude_utils import parse_claude_json
 from grocery_butler.models import Ingredient, IngredientCategory, ParsedMeal, parse_unit
 from grocery_butler.prompt_loader import load_prompt
 from grocery_butler.recipe_store import RecipeStore, normalize_recipe_name
@@ -23,6 +25,33 @@ logger = logging.getLogger(__name__)
 
 _MATCH_CONFIDENCE_THRESHOLD = 0.6
 
+# Upper bound on meals resolved concurrently. Unknown meals cost one or
+# two Claude round-trips each, so a small pool overlaps that latency
+# without flooding the API.
+_MAX_MEAL_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class _PromptContext:
+    """Store-backed prompt inputs shared by every meal in one batch.
+
+    Values are stored already formatted for the templates, so each
+    Claude call in the batch reuses the same strings.
+
+    Attributes:
+        recipe_lines: Recipe display names, one per line, or "" if none.
+        known_recipes: Comma-separated recipe display names, or "None".
+        pantry_staples: Comma-separated pantry staple names, or "None".
+        dietary: Dietary restrictions, or "None".
+        units: Measurement units preference.
+    """
+
+    recipe_lines: str
+    known_recipes: str
+    pantry_staples: str
+    dietary: str
+    units: str
+
 
 def _build_stub_meal(name: str, servings: int) -> ParsedMeal:
     """Build a stub ParsedMeal for graceful degradation.
@@ -162,6 +191,10 @@ class MealParser:
         3. If still not found, call Claude to decompose the meal.
         4. Adjust serving sizes when requested.
 
+        Meals are independent, so several are resolved concurrently on
+        a thread pool; results keep the input order. A name repeated in
+        the plan is resolved once and its result reused.
+
         Args:
             meal_names: List of meal name strings to parse.
             servings: Optional override for the number of servings.
@@ -174,13 +207,29 @@ class MealParser:
 
         default_servings = self._get_default_servings()
         target_servings = servings if servings is not None else default_servings
-        results: list[ParsedMeal] = []
-
-        for name in meal_names:
-            meal = self._resolve_single_meal(name, target_servings)
-            results.append(meal)
-
-        return results
+        # Read the prompt inputs once for the whole batch rather than
+        # once per Claude call.
+        context = self._load_prompt_context() if self._client is not None else None
+        unique_names = list(dict.fromkeys(meal_names))
+        if len(unique_names) == 1:
+            meal = self._resolve_single_meal(unique_names[0], target_servings, context)
+            return [meal] * len(meal_names)
+
+        workers = min(_MAX_MEAL_WORKERS, len(unique_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            resolved = dict(
+                zip(
+                    unique_names,
+                    executor.map(
+                        self._resolve_single_meal,
+                        unique_names,
+                        [target_servings] * len(unique_names),
+                        [context] * len(unique_names),
+                    ),
+                    strict=True,
+                )
+            )
+        return [resolved[name] for name in meal_names]
 
     def save_parsed_meal(self, meal: ParsedMeal) -> None:
         """Save a parsed meal to the recipe store.
@@ -198,12 +247,14 @@ class MealParser:
         self,
         name: str,
         target_servings: int,
+        context: _PromptContext | None = None,
     ) -> ParsedMeal:
         """Resolve a single meal name through the lookup pipeline.
 
         Args:
             name: Raw meal name string.
             target_servings: Desired number of servings.
+            context: Prompt inputs preloaded for the batch, if any.
 
         Returns:
             Resolved ParsedMeal.
@@ -214,18 +265,23 @@ class MealParser:
             return self._adjust_servings(stored, target_servings)
 
         # Step 2: Claude fuzzy matching against stored recipes
-        matched = self._try_fuzzy_match(name)
+        matched = self._try_fuzzy_match(name, context)
         if matched is not None:
             return self._adjust_servings(matched, target_servings)
 
         # Step 3: Claude meal decomposition
-        return self._decompose_meal(name, target_servings)
+        return self._decompose_meal(name, target_servings, context)
 
-    def _try_fuzzy_match(self, name: str) -> ParsedMeal | None:
+    def _try_fuzzy_match(
+        self,
+        name: str,
+        context: _PromptContext | None = None,
+    ) -> ParsedMeal | None:
         """Attempt Claude-powered fuzzy matching against stored recipes.
 
         Args:
             name: Meal name to match.
+            context: Preloaded prompt inputs; read from the store if None.
 
         Returns:
             Matched ParsedMeal or None if no match found.
@@ -233,15 +289,15 @@ class MealParser:
         if self._client is None:
             return None
 
-        recipes = self._store.list_recipes()
-        if not recipes:
+        if context is None:
+            context = self._load_prompt_context()
+        if not context.recipe_lines:
             return None
 
-        recipe_list = "\n".join(str(r["display_name"]) for r in recipes)
         prompt = load_prompt(
             "recipe_matching",
             query=name,
-            recipe_list=recipe_list,
+            recipe_list=context.recipe_lines,
         )
 
         response_text = self._call_claude(prompt)
@@ -263,7 +319,7 @@ class MealParser:
             Matched ParsedMeal or None.
         """
         try:
-            data = json.loads(extract_json_text(response_text))
+            data = parse_claude_json(response_text)
         except (json.JSONDecodeError, ValueError):
             logger.warning("Failed to parse fuzzy match response")
             return None
@@ -283,12 +339,14 @@ class MealParser:
         self,
         name: str,
         target_servings: int,
+        context: _PromptContext | None = None,
     ) -> ParsedMeal:
         """Decompose an unknown meal using Claude.
 
         Args:
             name: Meal name to decompose.
             target_servings: Desired number of servings.
+            context: Preloaded prompt inputs; read from the store if None.
 
         Returns:
             ParsedMeal with needs_confirmation=True, or a stub if no client.
@@ -296,7 +354,7 @@ class MealParser:
         if self._client is None:
             return _build_stub_meal(name, target_servings)
 
-        prompt = self._build_decomposition_prompt(name, target_servings)
+        prompt = self._build_decomposition_prompt(name, target_servings, context)
         response_text = self._call_claude(prompt)
         if response_text is None:
             return _build_stub_meal(name, target_servings)
@@ -335,7 +393,8 @@ class MealParser:
                 max_tokens=4096,
                 messages=[{"role": "user", "content": prompt}],
             )
-            return str(response.content[0].text)
+            text: str = response.content[0].text
+            return text
         except Exception:
             logger.exception("Claude API call failed")
             return None
@@ -371,7 +430,8 @@ class MealParser:
                     },
                 ],
             )
-            return str(response.content[0].text)
+            text: str = response.content[0].text
+            return text
         except Exception:
             logger.exception("Claude retry call failed")
             return None
@@ -395,8 +455,7 @@ class MealParser:
             ParsedMeal or None if parsing fails.
         """
         try:
-            cleaned = extract_json_text(response_text)
-            data = json.loads(cleaned)
+            data = parse_claude_json(response_text)
         except (json.JSONDecodeError, ValueError):
             logger.warning("Failed to parse decomposition response")
             return None
@@ -447,34 +506,47 @@ class MealParser:
         self,
         meal_name: str,
         target_servings: int,
+        context: _PromptContext | None = None,
     ) -> str:
         """Build the meal decomposition prompt.
 
         Args:
             meal_name: Name of the meal to decompose.
             target_servings: Desired number of servings.
+            context: Preloaded prompt inputs; read from the store if None.
 
         Returns:
             Formatted prompt string.
         """
-        pantry_names = self._store.get_pantry_staple_names()
-        recipes = self._store.list_recipes()
-        known_recipe_names = [str(r["display_name"]) for r in recipes]
-        dietary = self._get_dietary_restrictions()
-        units = self._get_units()
+        if context is None:
+            context = self._load_prompt_context()
 
         prompt = load_prompt(
             "meal_decomposition",
             default_servings=str(target_servings),
-            dietary_restrictions=dietary if dietary else "None",
-            pantry_staples=", ".join(pantry_names) if pantry_names else "None",
-            units=units,
-            known_recipes=(
-                ", ".join(known_recipe_names) if known_recipe_names else "None"
-            ),
+            dietary_restrictions=context.dietary,
+            pantry_staples=context.pantry_staples,
+            units=context.units,
+            known_recipes=context.known_recipes,
         )
         return f"{prompt}\n\nMeals to decompose:\n- {meal_name}"
 
+    def _load_prompt_context(self) -> _PromptContext:
+        """Read the store-backed inputs used by the Claude prompts.
+
+        Returns:
+            Recipe names, pantry staples, and preferences for prompts.
+        """
+        recipe_names = [str(r["display_name"]) for r in self._store.list_recipes()]
+        pantry_names = self._store.get_pantry_staple_names()
+        return _PromptContext(
+            recipe_lines="\n".join(recipe_names),
+            known_recipes=", ".join(recipe_names) or "None",
+            pantry_staples=", ".join(pantry_names) or "None",
+            dietary=self._get_dietary_restrictions() or "None",
+            units=self._get_units(),
+        )
+
     # ------------------------------------------------------------------
     # Configuration helpers
     # ------------------------------------------------------------------
@@ -7,6 +7,7 @@ including future Safeway models that aren't used yet.
 from __future__ import annotations
 
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, field_validator
@@ -138,11 +139,14 @@ _UNIT_ALIASES: dict[str, Unit] = {
 }
 
 
+@lru_cache(maxsize=256)
 def parse_unit(raw: str) -> Unit:
     """Parse a raw unit string into a Unit enum member.
 
     Handles exact matches, aliases, and case-insensitive lookup.
-    Falls back to Unit.EACH for unrecognized strings.
+    Falls back to Unit.EACH for unrecognized strings. Memoized: the
+    same few dozen unit spellings recur across LLM output, database
+    rows, and migrations.
 
     Args:
         raw: Raw unit string from LLM output, database, or user input.
@@ -13,16 +13,29 @@ from __future__ import annotations
 import json
 import logging
 from datetime import UTC, datetime
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
+from grocery_butler.claude_utils import parse_claude_json
 from grocery_butler.db import get_connection, init_db
 from grocery_butler.models import InventoryItem, InventoryStatus, InventoryUpdate
 from grocery_butler.prompt_loader import load_prompt
+from grocery_butler.recipe_store import fetch_pantry_staple_names
+
+if TYPE_CHECKING:
+    from grocery_butler.db.adapter import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
 _RESTOCK_STATUSES = (InventoryStatus.LOW, InventoryStatus.OUT)
 
+_RESTOCK_QUEUE_SQL = (
+    "SELECT ingredient, display_name, category, status, "
+    "current_quantity, current_unit, "
+    "default_quantity, default_unit, default_search_term, notes "
+    "FROM household_inventory WHERE status IN (?, ?) "
+    "ORDER BY ingredient"
+)
+
 
 class RecipeStoreProtocol(Protocol):
     """Protocol for RecipeStore pantry staple lookup.
@@ -185,6 +198,36 @@ class PantryManager:
         finally:
             conn.close()
 
+    def update_status_bulk(self, updates: list[tuple[str, InventoryStatus]]) -> int:
+        """Apply several status changes in a single transaction.
+
+        Args:
+            updates: ``(ingredient, new_status)`` pairs; ingredient names
+                are matched case-insensitively.
+
+        Returns:
+            Number of items actually updated.
+        """
+        if not updates:
+            return 0
+
+        now = datetime.now(tz=UTC).isoformat()
+        conn = get_connection(self._db_path)
+        try:
+            total_updated = conn.executemany(
+                "UPDATE household_inventory "
+                "SET status = ?, last_status_change = ? "
+                "WHERE LOWER(ingredient) = ?",
+                [
+                    (new_status.value, now, ingredient.lower())
+                    for ingredient, new_status in updates
+                ],
+            )
+            conn.commit()
+            return total_updated
+        finally:
+            conn.close()
+
     def update_quantity(self, ingredient: str, quantity: float, unit: str) -> None:
         """Update an item's current quantity and unit.
 
@@ -247,15 +290,23 @@ class PantryManager:
         """
         conn = get_connection(self._db_path)
         try:
-            cursor = conn.execute(
-                "SELECT ingredient, display_name, category, status, "
-                "current_quantity, current_unit, "
-                "default_quantity, default_unit, default_search_term, notes "
-                "FROM household_inventory WHERE status IN (?, ?) "
-                "ORDER BY ingredient",
-                (InventoryStatus.LOW.value, InventoryStatus.OUT.value),
-            )
-            return [_row_to_item(row) for row in cursor.fetchall()]
+            return _fetch_restock_queue(conn)
+        finally:
+            conn.close()
+
+    def get_restock_and_staples(self) -> tuple[list[InventoryItem], list[str]]:
+        """Return the restock queue and pantry staple names in one round-trip.
+
+        Both tables live in the same database, so one connection serves
+        the two SELECTs that meal planning always runs back to back.
+
+        Returns:
+            Tuple of (items needing restocking, pantry staple ingredient
+            names), each ordered by ingredient.
+        """
+        conn = get_connection(self._db_path)
+        try:
+            return _fetch_restock_queue(conn), fetch_pantry_staple_names(conn)
         finally:
             conn.close()
 
@@ -336,6 +387,22 @@ class PantryManager:
         return _call_claude_with_retry(self._client, prompt)
 
 
+def _fetch_restock_queue(conn: DatabaseConnection) -> list[InventoryItem]:
+    """Read low/out inventory items on an open connection.
+
+    Args:
+        conn: Open database connection.
+
+    Returns:
+        Items needing restocking, ordered by ingredient.
+    """
+    cursor = conn.execute(
+        _RESTOCK_QUEUE_SQL,
+        tuple(status.value for status in _RESTOCK_STATUSES),
+    )
+    return [_row_to_item(row) for row in cursor.fetchall()]
+
+
 def _row_to_item(row: Any) -> InventoryItem:
     """Convert a database row to an InventoryItem model.
 
@@ -383,7 +450,9 @@ def _format_inventory_context(items: list[InventoryItem]) -> str:
 def _parse_claude_response(text: str) -> list[InventoryUpdate]:
     """Parse Claude's JSON response into InventoryUpdate objects.
 
-    Filters out low-confidence matches (< 0.8).
+    Filters out low-confidence matches (< 0.8). Decoding goes through
+    :func:`parse_claude_json`, like the other Claude parsers, so it uses
+    orjson when installed and tolerates markdown fences.
 
     Args:
         text: Raw text response from Claude API.
@@ -395,7 +464,7 @@ def _parse_claude_response(text: str) -> list[InventoryUpdate]:
         json.JSONDecodeError: If the response is not valid JSON.
         ValueError: If the JSON structure is invalid.
     """
-    data = json.loads(text)
+    data = parse_claude_json(text)
     if not isinstance(data, list):
         raise ValueError("Expected a JSON array")
 
@@ -17,7 +17,7 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from grocery_butler.claude_utils import extract_json_text, filter_avoided_brands
+from grocery_butler.claude_utils import filter_avoided_brands, parse_claude_json
 from grocery_butler.models import (
     BrandPreference,
     BrandPreferenceType,
@@ -248,7 +248,8 @@ class ProductSelector:
                 max_tokens=_MAX_TOKENS,
                 messages=[{"role": "user", "content": prompt}],
             )
-            return str(response.content[0].text)
+            text: str = response.content[0].text
+            return text
         except Exception:
             logger.exception("Claude product selection call failed")
             return None
@@ -388,9 +389,8 @@ def _parse_selection_response(
     Returns:
         Tuple of (selected_product, reasoning) or None on parse failure.
     """
-    cleaned = extract_json_text(text)
     try:
-        data = json.loads(cleaned)
+        data = parse_claude_json(text)
     except json.JSONDecodeError:
         logger.warning("Failed to parse product selection response as JSON")
         return None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 PROMPTS_DIR = Path(__file__).parent / "prompts"
@@ -21,10 +22,29 @@ def load_prompt(name: str, **kwargs: str) -> str:
         FileNotFoundError: If template doesn't exist.
         KeyError: If a required variable is missing.
     """
+    return load_prompt_template(name).format(**kwargs)
+
+
+@functools.lru_cache(maxsize=16)
+def load_prompt_template(name: str) -> str:
+    """Read a prompt template's unformatted text.
+
+    Templates ship with the package and never change at runtime, so
+    each file is read once per process. Missing templates are not
+    cached.
+
+    Args:
+        name: Template name (without .txt extension).
+
+    Returns:
+        Raw template text with ``{placeholders}`` intact.
+
+    Raises:
+        FileNotFoundError: If template doesn't exist.
+    """
     template_path = PROMPTS_DIR / f"{name}.txt"
     if not template_path.exists():
         raise FileNotFoundError(
             f"Prompt template not found: {name} (looked in {template_path})"
         )
-    template = template_path.read_text()
-    return template.format(**kwargs)
+    return template_path.read_text()
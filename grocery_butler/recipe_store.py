@@ -50,6 +50,24 @@ def normalize_recipe_name(name: str) -> str:
     return result
 
 
+def fetch_pantry_staple_names(conn: DatabaseConnection) -> list[str]:
+    """Read pantry staple ingredient names on an open connection.
+
+    Shared with :class:`~grocery_butler.pantry_manager.PantryManager`,
+    which reads staples alongside the restock queue on one connection.
+
+    Args:
+        conn: Open database connection.
+
+    Returns:
+        Staple ingredient names ordered by ingredient.
+    """
+    rows = conn.execute(
+        "SELECT ingredient FROM pantry_staples ORDER BY ingredient",
+    ).fetchall()
+    return [row["ingredient"] for row in rows]
+
+
 def _row_to_parsed_meal(
     recipe_row: DictRow,
     ingredient_rows: list[DictRow],
@@ -314,6 +332,25 @@ class RecipeStore:
     # Fuzzy recipe lookup
     # ------------------------------------------------------------------
 
+    def find_recipe_id(self, name: str) -> int | None:
+        """Look up a recipe's ID by exact normalized name.
+
+        Args:
+            name: Recipe name (normalized before lookup).
+
+        Returns:
+            The recipe's database ID, or None if no recipe has that name.
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT id FROM recipes WHERE name = ? LIMIT 1",
+                (normalize_recipe_name(name),),
+            ).fetchone()
+            return None if row is None else int(row["id"])
+        finally:
+            conn.close()
+
     def find_recipe(self, query: str) -> ParsedMeal | None:
         """Find a recipe by exact or substring match.
 
@@ -376,10 +413,7 @@ class RecipeStore:
         """
         conn = self._connect()
         try:
-            rows = conn.execute(
-                "SELECT ingredient FROM pantry_staples ORDER BY ingredient",
-            ).fetchall()
-            return [row["ingredient"] for row in rows]
+            return fetch_pantry_staple_names(conn)
         finally:
             conn.close()
 
@@ -571,6 +605,26 @@ class RecipeStore:
         finally:
             conn.close()
 
+    def remove_brand_preferences_for_target(self, match_target: str) -> int:
+        """Remove every brand preference for a match target.
+
+        Args:
+            match_target: Ingredient or category name (case-insensitive).
+
+        Returns:
+            Number of preferences removed.
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "DELETE FROM brand_preferences WHERE LOWER(match_target) = ?",
+                (match_target.lower(),),
+            )
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
     def get_brands_for_ingredient(
         self, ingredient: str, category: str | None = None
     ) -> list[BrandPreference]:
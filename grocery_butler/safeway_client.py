@@ -14,6 +14,7 @@ Authentication flow:
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -107,6 +108,8 @@ class SafewayClient:
         self._owns_client = http_client is None
         self._token = TokenState()
         self._last_request_time = 0.0
+        self._rate_lock = threading.Lock()
+        self._auth_lock = threading.Lock()
 
     @property
     def store_id(self) -> str:
@@ -208,23 +211,32 @@ class SafewayClient:
     def _ensure_authenticated(self) -> None:
         """Ensure the client has a valid token, refreshing if needed.
 
+        The check and refresh happen under a lock, so when a token
+        expires mid-build only one worker thread logs in again.
+
         Raises:
             SafewayAuthError: If re-authentication fails.
         """
-        if not self._token.access_token or self._token.is_expired:
-            self.authenticate()
+        with self._auth_lock:
+            if not self._token.access_token or self._token.is_expired:
+                self.authenticate()
 
     # ------------------------------------------------------------------
     # Rate limiting
     # ------------------------------------------------------------------
 
     def _rate_limit(self) -> None:
-        """Enforce rate limiting (~2 requests/second)."""
-        now = time.monotonic()
-        elapsed = now - self._last_request_time
-        if elapsed < _MIN_REQUEST_INTERVAL:
-            time.sleep(_MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request_time = time.monotonic()
+        """Enforce rate limiting (~2 requests/second).
+
+        Serialized with a lock so concurrent callers (e.g. the cart
+        builder's worker threads) still respect the shared interval.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_request_time
+            if elapsed < _MIN_REQUEST_INTERVAL:
+                time.sleep(_MIN_REQUEST_INTERVAL - elapsed)
+            self._last_request_time = time.monotonic()
 
     # ------------------------------------------------------------------
     # HTTP methods
@@ -298,13 +310,17 @@ class SafewayClient:
             SafewayAPIError: If the request fails after retry.
         """
         url = f"{NIMBUS_BASE}{path}"
-        result = self._send_request(method, url, params, json_data)
+        sent_token = self._token
+        result = self._send_request(method, url, params, json_data, sent_token)
         if result is not None:
             return result
 
-        # 401 — re-authenticate and retry once
-        self.authenticate()
-        retry = self._send_request(method, url, params, json_data)
+        # 401 — re-authenticate (unless another thread already has) and retry once
+        with self._auth_lock:
+            if self._token is sent_token:
+                self.authenticate()
+            retry_token = self._token
+        retry = self._send_request(method, url, params, json_data, retry_token)
         if retry is not None:
             return retry
         raise SafewayAPIError(f"Safeway API failed after re-auth: {method} {path}")
@@ -315,14 +331,20 @@ class SafewayClient:
         url: str,
         params: dict[str, str] | None,
         json_data: dict[str, Any] | None,
+        token: TokenState,
     ) -> dict[str, Any] | None:
         """Send a single HTTP request, returning None on 401.
 
+        The bearer token is passed in rather than read after the rate
+        limiter wait, so a 401 is always attributed to the token that
+        was actually sent.
+
         Args:
             method: HTTP method.
             url: Full URL.
             params: Optional query parameters.
             json_data: Optional JSON body.
+            token: Token to send in the ``Authorization`` header.
 
         Returns:
             Parsed JSON response, or None if 401 received.
@@ -337,7 +359,7 @@ class SafewayClient:
                 url,
                 params=params,
                 json=json_data,
-                headers=self._get_auth_headers(),
+                headers=_auth_headers(token),
             )
             response.raise_for_status()
             return response.json()  # type: ignore[no-any-return]  # httpx returns Any
@@ -350,17 +372,6 @@ class SafewayClient:
         except httpx.HTTPError as exc:
             raise SafewayAPIError(f"Safeway API request failed: {exc}") from exc
 
-    def _get_auth_headers(self) -> dict[str, str]:
-        """Build authorization headers for API requests.
-
-        Returns:
-            Dict with Authorization and Accept headers.
-        """
-        return {
-            "Authorization": f"Bearer {self._token.access_token}",
-            "Accept": "application/json",
-        }
-
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -376,6 +387,21 @@ class SafewayClient:
 # ------------------------------------------------------------------
 
 
+def _auth_headers(token: TokenState) -> dict[str, str]:
+    """Build authorization headers for API requests.
+
+    Args:
+        token: Token whose access token goes in the header.
+
+    Returns:
+        Dict with Authorization and Accept headers.
+    """
+    return {
+        "Authorization": f"Bearer {token.access_token}",
+        "Accept": "application/json",
+    }
+
+
 def _extract_session_token(data: dict[str, Any]) -> str:
     """Extract session token from Okta authn response.
 
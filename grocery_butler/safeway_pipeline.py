@@ -7,6 +7,7 @@ together, and exposes a two-step flow: build cart → submit order.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING, Any
 
 from grocery_butler.cart_builder import CartBuilder
@@ -39,6 +40,8 @@ class SafewayPipeline:
         config: Application configuration with Safeway credentials.
         db_path: Path to the SQLite database.
         anthropic_client: Optional Anthropic API client for Claude calls.
+        recipe_store: Optional existing recipe store to reuse.
+        pantry_manager: Optional existing pantry manager to reuse.
     """
 
     def __init__(
@@ -46,6 +49,8 @@ class SafewayPipeline:
         config: Config,
         db_path: str,
         anthropic_client: Any = None,
+        recipe_store: RecipeStore | None = None,
+        pantry_manager: PantryManager | None = None,
     ) -> None:
         """Initialize the pipeline and bootstrap all services.
 
@@ -53,6 +58,10 @@ class SafewayPipeline:
             config: Application configuration with Safeway credentials.
             db_path: Path to the SQLite database.
             anthropic_client: Optional Anthropic API client.
+            recipe_store: Recipe store to reuse; built from ``db_path``
+                if omitted.
+            pantry_manager: Pantry manager to reuse; built from
+                ``db_path`` if omitted.
 
         Raises:
             SafewayPipelineError: If required Safeway config is missing.
@@ -67,13 +76,15 @@ class SafewayPipeline:
                 "Safeway store ID required: set SAFEWAY_STORE_ID in .env"
             )
 
+        self._auth_lock = threading.Lock()
         self._client = SafewayClient(
             username=config.safeway_username,
             password=config.safeway_password,
             store_id=config.safeway_store_id,
         )
 
-        recipe_store = RecipeStore(db_path)
+        if recipe_store is None:
+            recipe_store = RecipeStore(db_path)
         search_service = ProductSearchService(self._client, db_path)
         selector = ProductSelector(anthropic_client, recipe_store)
         substitution = SubstitutionService(
@@ -84,7 +95,8 @@ class SafewayPipeline:
             search_service, selector, substitution, self._client
         )
 
-        pantry_manager = PantryManager(db_path, anthropic_client)
+        if pantry_manager is None:
+            pantry_manager = PantryManager(db_path, anthropic_client)
         self._order_service = OrderService(self._client, pantry_manager)
 
     def run(
@@ -153,12 +165,18 @@ class SafewayPipeline:
     def _authenticate(self) -> None:
         """Authenticate with Safeway if not already authenticated.
 
+        Serialized so concurrent commands sharing this pipeline log in
+        only once.
+
         Raises:
             SafewayPipelineError: If authentication fails.
         """
-        if self._client.is_authenticated:
-            return
-        try:
-            self._client.authenticate()
-        except Exception as exc:
-            raise SafewayPipelineError(f"Safeway authentication failed: {exc}") from exc
+        with self._auth_lock:
+            if self._client.is_authenticated:
+                return
+            try:
+                self._client.authenticate()
+            except Exception as exc:
+                raise SafewayPipelineError(
+                    f"Safeway authentication failed: {exc}"
+                ) from exc
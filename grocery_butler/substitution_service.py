@@ -12,7 +12,7 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any
 
-from grocery_butler.claude_utils import extract_json_text, filter_avoided_brands
+from grocery_butler.claude_utils import filter_avoided_brands, parse_claude_json
 from grocery_butler.models import (
     BrandPreference,
     BrandPreferenceType,
@@ -206,7 +206,8 @@ class SubstitutionService:
                 max_tokens=_MAX_TOKENS,
                 messages=[{"role": "user", "content": prompt}],
             )
-            return str(response.content[0].text)
+            text: str = response.content[0].text
+            return text
         except Exception:
             logger.exception("Claude substitution ranking call failed")
             return None
@@ -252,9 +253,8 @@ def _parse_ranking_response(
     Returns:
         Ordered list of SubstitutionOption, or None on parse failure.
     """
-    cleaned = extract_json_text(text)
     try:
-        data = json.loads(cleaned)
+        data = parse_claude_json(text)
     except json.JSONDecodeError:
         logger.warning("Failed to parse substitution ranking as JSON")
         return None
@@ -186,6 +186,21 @@ class TestSQLiteConnection:
         finally:
             conn.close()
 
+    def test_executemany(self, tmp_path: Path) -> None:
+        """Test executemany runs the statement once per parameter tuple."""
+        conn = create_connection(str(tmp_path / "test.db"))
+        try:
+            conn.executescript("CREATE TABLE t (id INTEGER PRIMARY KEY, val TEXT);")
+            inserted = conn.executemany(
+                "INSERT INTO t (id, val) VALUES (?, ?)",
+                [(1, "a"), (2, "b"), (3, "c")],
+            )
+            assert inserted == 3
+            rows = conn.execute("SELECT val FROM t ORDER BY id").fetchall()
+            assert [r["val"] for r in rows] == ["a", "b", "c"]
+        finally:
+            conn.close()
+
     def test_commit(self, tmp_path: Path) -> None:
         """Test commit persists data across connections."""
         db_path = str(tmp_path / "test.db")
@@ -235,6 +250,18 @@ class TestSQLiteConnection:
         finally:
             conn.close()
 
+    def test_memory_db_enables_foreign_keys(self) -> None:
+        """Test in-memory connections still enforce foreign keys."""
+        conn = create_connection(":memory:")
+        try:
+            assert isinstance(conn, SQLiteConnection)
+            result = conn.raw.execute("PRAGMA foreign_keys").fetchone()
+            assert result[0] == 1
+            result = conn.raw.execute("PRAGMA journal_mode").fetchone()
+            assert result[0] == "memory"
+        finally:
+            conn.close()
+
 
 class TestIntegrityError:
     """Tests for the unified IntegrityError."""
@@ -485,6 +512,25 @@ class TestPostgresConnection:
         finally:
             conn.close()
 
+    def test_executemany_rowcount(self) -> None:
+        """Test executemany reports the total rows affected on PostgreSQL."""
+        self._setup_table()
+        conn = create_connection(_TEST_DB_URL)
+        try:
+            inserted = conn.executemany(
+                "INSERT INTO adapter_test (name) VALUES (?)",
+                [("m1",), ("m2",), ("m3",)],
+            )
+            assert inserted == 3
+            deleted = conn.executemany(
+                "DELETE FROM adapter_test WHERE name = ?",
+                [("m1",), ("m3",), ("missing",)],
+            )
+            assert deleted == 2
+            conn.commit()
+        finally:
+            conn.close()
+
     def test_pragma_silently_skipped(self) -> None:
         """Test PRAGMA statements are silently skipped on Postgres."""
         conn = create_connection(_TEST_DB_URL)
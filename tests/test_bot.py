@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import discord
@@ -583,6 +584,18 @@ class TestCreateBot:
         assert hasattr(bot, "config")
         assert bot.config == config  # type: ignore[attr-defined]
 
+    @pytest.mark.asyncio()
+    async def test_setup_hook_sizes_default_executor(self, config):
+        """Test setup_hook installs an executor sized from config."""
+        bot = create_bot(config)
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "set_default_executor") as mock_set:
+            await bot.setup_hook()
+
+        executor = mock_set.call_args.args[0]
+        assert executor._max_workers == config.thread_pool_size
+        executor.shutdown(wait=False)
+
 
 # ---------------------------------------------------------------------------
 # TestDiscordPermissions - verify native permission decorators
@@ -1120,7 +1133,7 @@ class TestBrandsCommands:
         cmd = self._get_subcommand(bot, "show")
         assert cmd is not None
         with patch(
-            "grocery_butler.bot.asyncio.to_thread",
+            "grocery_butler.bot._to_thread_fast",
             side_effect=RuntimeError("db"),
         ):
             await cmd.callback(mock_interaction)
@@ -1143,7 +1156,7 @@ class TestBrandsCommands:
         cmd = self._get_subcommand(bot, "set")
         assert cmd is not None
         with patch(
-            "grocery_butler.bot.asyncio.to_thread",
+            "grocery_butler.bot._to_thread_fast",
             side_effect=RuntimeError("db"),
         ):
             await cmd.callback(mock_interaction, target="milk", brand="test")
@@ -1165,7 +1178,7 @@ class TestBrandsCommands:
         cmd = self._get_subcommand(bot, "avoid")
         assert cmd is not None
         with patch(
-            "grocery_butler.bot.asyncio.to_thread",
+            "grocery_butler.bot._to_thread_fast",
             side_effect=RuntimeError("db"),
         ):
             await cmd.callback(mock_interaction, brand="test")
@@ -1181,13 +1194,32 @@ class TestBrandsCommands:
         call_args = str(mock_interaction.response.send_message.call_args)
         assert "No brand preferences" in call_args
 
+    @pytest.mark.asyncio()
+    async def test_brands_clear_removes_matching(self, bot, mock_interaction):
+        """Test /brands clear removes every preference for the target."""
+        set_cmd = self._get_subcommand(bot, "set")
+        assert set_cmd is not None
+        await set_cmd.callback(mock_interaction, target="Kefir", brand="Lifeway")
+        await set_cmd.callback(mock_interaction, target="kefir", brand="Maple Hill")
+
+        cmd = self._get_subcommand(bot, "clear")
+        assert cmd is not None
+        await cmd.callback(mock_interaction, target="KEFIR")
+        call_args = str(mock_interaction.response.send_message.call_args)
+        assert "Cleared" in call_args
+
+        mock_interaction.response.send_message.reset_mock()
+        await cmd.callback(mock_interaction, target="kefir")
+        call_args = str(mock_interaction.response.send_message.call_args)
+        assert "No brand preferences" in call_args
+
     @pytest.mark.asyncio()
     async def test_brands_clear_error(self, bot, mock_interaction):
         """Test /brands clear handles errors gracefully."""
         cmd = self._get_subcommand(bot, "clear")
         assert cmd is not None
         with patch(
-            "grocery_butler.bot.asyncio.to_thread",
+            "grocery_butler.bot._to_thread_fast",
             side_effect=RuntimeError("db"),
         ):
             await cmd.callback(mock_interaction, target="milk")
@@ -1227,7 +1259,7 @@ class TestRecipesCommands:
         cmd = self._get_subcommand(bot, "list")
         assert cmd is not None
         with patch(
-            "grocery_butler.bot.asyncio.to_thread",
+            "grocery_butler.bot._to_thread_fast",
             side_effect=RuntimeError("db"),
         ):
             await cmd.callback(mock_interaction)
@@ -1249,7 +1281,7 @@ class TestRecipesCommands:
         cmd = self._get_subcommand(bot, "show")
         assert cmd is not None
         with patch(
-            "grocery_butler.bot.asyncio.to_thread",
+            "grocery_butler.bot._to_thread_fast",
             side_effect=RuntimeError("db"),
         ):
             await cmd.callback(mock_interaction, name="pasta")
@@ -1265,13 +1297,30 @@ class TestRecipesCommands:
         call_args = str(mock_interaction.response.send_message.call_args)
         assert "not found" in call_args
 
+    @pytest.mark.asyncio()
+    async def test_recipes_forget_deletes_by_id(self, bot, mock_interaction):
+        """Test /recipes forget looks up the ID and deletes that recipe."""
+        cmd = self._get_subcommand(bot, "forget")
+        assert cmd is not None
+        with patch(
+            "grocery_butler.bot._to_thread_fast",
+            side_effect=[
+                7,  # find_recipe_id
+                None,  # delete_recipe
+            ],
+        ) as mock_thread:
+            await cmd.callback(mock_interaction, name="Pasta")
+        assert mock_thread.call_args_list[1].args[1] == 7
+        call_args = str(mock_interaction.response.send_message.call_args)
+        assert "Deleted recipe" in call_args
+
     @pytest.mark.asyncio()
     async def test_recipes_forget_error(self, bot, mock_interaction):
         """Test /recipes forget handles errors gracefully."""
         cmd = self._get_subcommand(bot, "forget")
         assert cmd is not None
         with patch(
-            "grocery_butler.bot.asyncio.to_thread",
+            "grocery_butler.bot._to_thread_fast",
             side_effect=RuntimeError("db"),
         ):
             await cmd.callback(mock_interaction, name="pasta")
@@ -1311,7 +1360,7 @@ class TestPreferencesCommands:
         cmd = self._get_subcommand(bot, "show")
         assert cmd is not None
         with patch(
-            "grocery_butler.bot.asyncio.to_thread",
+            "grocery_butler.bot._to_thread_fast",
             side_effect=RuntimeError("db"),
         ):
             await cmd.callback(mock_interaction)
@@ -1334,7 +1383,7 @@ class TestPreferencesCommands:
         cmd = self._get_subcommand(bot, "set")
         assert cmd is not None
         with patch(
-            "grocery_butler.bot.asyncio.to_thread",
+            "grocery_butler.bot._to_thread_fast",
             side_effect=RuntimeError("db"),
         ):
             await cmd.callback(mock_interaction, key="test", value="val")
@@ -1443,6 +1492,27 @@ class TestOnMessageEvent:
             await bot.on_message(message)  # type: ignore[attr-defined]
         message.reply.assert_not_called()
 
+    @pytest.mark.asyncio()
+    async def test_permissions_checked_on_every_message(self, bot):
+        """Test a revoked manage_guild takes effect on the next message."""
+        message = _make_guild_message(manage_guild=True, content="/help")
+
+        mock_user = MagicMock()
+        mock_user.id = 111111
+
+        with patch.object(
+            type(bot),
+            "user",
+            new_callable=PropertyMock,
+            return_value=mock_user,
+        ):
+            await bot.on_message(message)  # type: ignore[attr-defined]
+            message.channel.permissions_for.return_value.manage_guild = False
+            message.content = "we are out of milk"
+            await bot.on_message(message)  # type: ignore[attr-defined]
+        assert message.channel.permissions_for.call_count == 2
+        message.reply.assert_not_called()
+
     @pytest.mark.asyncio()
     async def test_ignores_command_messages(self, bot):
         """Test on_message ignores messages starting with /."""
@@ -1524,7 +1594,7 @@ class TestOnMessageEvent:
         ):
             mock_thread.side_effect = [
                 updates,  # parse_inventory_intent
-                None,  # update_status
+                1,  # update_status_bulk
             ]
             await bot.on_message(message)  # type: ignore[attr-defined]
 
@@ -1875,19 +1945,67 @@ class TestOrderCommandGroup:
         assert "review" in subcommand_names
         assert "submit" in subcommand_names
 
+    @pytest.mark.asyncio()
+    async def test_review_reuses_one_pipeline(self, config, mock_interaction):
+        """Test repeated /order review calls share a single pipeline."""
+        with (
+            patch("grocery_butler.safeway_pipeline.SafewayPipeline") as mock_cls,
+            patch("grocery_butler.bot._format_cart_summary", return_value="cart"),
+            patch("grocery_butler.bot.asyncio.to_thread", new=AsyncMock()),
+        ):
+            bot = create_bot(config)
+            group = self._get_group(bot, "order")
+            review = next(cmd for cmd in group.commands if cmd.name == "review")
+            await review.callback(mock_interaction, items="milk")
+            await review.callback(mock_interaction, items="eggs")
+
+        mock_cls.assert_called_once()
+        mock_cls.return_value.close.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_close_closes_shared_pipeline(self, config, mock_interaction):
+        """Test closing the bot releases the shared pipeline."""
+        with (
+            patch("grocery_butler.safeway_pipeline.SafewayPipeline") as mock_cls,
+            patch("grocery_butler.bot._format_cart_summary", return_value="cart"),
+        ):
+            bot = create_bot(config)
+            group = self._get_group(bot, "order")
+            review = next(cmd for cmd in group.commands if cmd.name == "review")
+            await review.callback(mock_interaction, items="milk")
+            await bot.close()
+
+        mock_cls.return_value.close.assert_called_once()
+
+    @pytest.mark.asyncio()
+    async def test_class_level_close_closes_shared_pipeline(
+        self, config, mock_interaction
+    ):
+        """Test cleanup runs when close is looked up on the client class."""
+        with (
+            patch("grocery_butler.safeway_pipeline.SafewayPipeline") as mock_cls,
+            patch("grocery_butler.bot._format_cart_summary", return_value="cart"),
+        ):
+            bot = create_bot(config)
+            group = self._get_group(bot, "order")
+            review = next(cmd for cmd in group.commands if cmd.name == "review")
+            await review.callback(mock_interaction, items="milk")
+            await type(bot).close(bot)
+
+        mock_cls.return_value.close.assert_called_once()
+
 
 class TestOrderConfirmViewTimeout:
     """Tests for _OrderConfirmView.on_timeout resource cleanup."""
 
-    def test_on_timeout_closes_pipeline(self):
-        """Test that on_timeout calls pipeline.close."""
-        import asyncio
+    def test_on_timeout_keeps_shared_pipeline_open(self):
+        """Test that on_timeout leaves the bot's shared pipeline open."""
 
         async def _run():
             mock_pipeline = MagicMock()
             mock_cart = MagicMock()
             view = _OrderConfirmView(mock_pipeline, mock_cart)
             await view.on_timeout()
-            mock_pipeline.close.assert_called_once()
+            mock_pipeline.close.assert_not_called()
 
         asyncio.run(_run())
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from unittest.mock import MagicMock
 
@@ -10,7 +11,7 @@ from grocery_butler.cart_builder import (
     _calculate_quantity,
     _calculate_subtotal,
     _default_fulfillment_options,
-    _get_fulfillment_fee,
+    _index_options,
     _parse_fulfillment_response,
     _parse_product_size,
     _recommend_fulfillment,
@@ -145,6 +146,10 @@ class TestParseProductSize:
         """Test size with leading whitespace."""
         assert _parse_product_size("  16 oz") == 16.0
 
+    def test_malformed_number(self) -> None:
+        """Test a run of digits and dots that is not a float returns 0."""
+        assert _parse_product_size("1.2.3 oz") == 0.0
+
 
 # ------------------------------------------------------------------
 # Tests: _calculate_quantity
@@ -208,6 +213,12 @@ class TestCalculateSubtotal:
         """Test empty lists returns 0."""
         assert _calculate_subtotal([], []) == 0.0
 
+    def test_no_float_drift(self) -> None:
+        """Test many small prices sum exactly to the cent."""
+        items = [_make_cart_item(price=0.1) for _ in range(10)]
+        restock = [_make_cart_item(price=0.2)]
+        assert _calculate_subtotal(items, restock) == 1.2
+
 
 # ------------------------------------------------------------------
 # Tests: _recommend_fulfillment
@@ -233,7 +244,7 @@ class TestRecommendFulfillment:
                 windows=[],
             ),
         ]
-        assert _recommend_fulfillment(options) == FulfillmentType.PICKUP
+        assert _recommend_fulfillment(_index_options(options)) == FulfillmentType.PICKUP
 
     def test_delivery_when_no_pickup(self) -> None:
         """Test delivery when pickup unavailable."""
@@ -251,11 +262,13 @@ class TestRecommendFulfillment:
                 windows=[],
             ),
         ]
-        assert _recommend_fulfillment(options) == FulfillmentType.DELIVERY
+        assert (
+            _recommend_fulfillment(_index_options(options)) == FulfillmentType.DELIVERY
+        )
 
     def test_empty_options(self) -> None:
         """Test defaults to pickup with no options."""
-        assert _recommend_fulfillment([]) == FulfillmentType.PICKUP
+        assert _recommend_fulfillment({}) == FulfillmentType.PICKUP
 
     def test_none_available(self) -> None:
         """Test defaults to pickup when none available."""
@@ -267,19 +280,19 @@ class TestRecommendFulfillment:
                 windows=[],
             ),
         ]
-        assert _recommend_fulfillment(options) == FulfillmentType.PICKUP
+        assert _recommend_fulfillment(_index_options(options)) == FulfillmentType.PICKUP
 
 
 # ------------------------------------------------------------------
-# Tests: _get_fulfillment_fee
+# Tests: _index_options
 # ------------------------------------------------------------------
 
 
-class TestGetFulfillmentFee:
-    """Tests for _get_fulfillment_fee."""
+class TestIndexOptions:
+    """Tests for _index_options."""
 
-    def test_finds_fee(self) -> None:
-        """Test finding fee for recommended type."""
+    def test_indexes_by_type(self) -> None:
+        """Test options are keyed by fulfillment type."""
         options = [
             FulfillmentOption(
                 type=FulfillmentType.PICKUP,
@@ -294,11 +307,31 @@ class TestGetFulfillmentFee:
                 windows=[],
             ),
         ]
-        assert _get_fulfillment_fee(options, FulfillmentType.DELIVERY) == 9.95
+        indexed = _index_options(options)
+        assert indexed[FulfillmentType.DELIVERY].fee == 9.95
+        assert list(indexed) == [FulfillmentType.PICKUP, FulfillmentType.DELIVERY]
 
-    def test_missing_type(self) -> None:
-        """Test returns 0 when type not found."""
-        assert _get_fulfillment_fee([], FulfillmentType.PICKUP) == 0.0
+    def test_first_duplicate_wins(self) -> None:
+        """Test the first option of a repeated type is kept."""
+        options = [
+            FulfillmentOption(
+                type=FulfillmentType.DELIVERY,
+                available=True,
+                fee=5.0,
+                windows=[],
+            ),
+            FulfillmentOption(
+                type=FulfillmentType.DELIVERY,
+                available=True,
+                fee=9.95,
+                windows=[],
+            ),
+        ]
+        assert _index_options(options)[FulfillmentType.DELIVERY].fee == 5.0
+
+    def test_empty(self) -> None:
+        """Test empty options yield an empty index."""
+        assert _index_options([]) == {}
 
 
 # ------------------------------------------------------------------
@@ -581,6 +614,45 @@ class TestBuildCart:
         assert len(result.fulfillment_options) == 2
         assert result.recommended_fulfillment == FulfillmentType.PICKUP
 
+    def test_many_items_keep_input_order(self) -> None:
+        """Test concurrently processed items come back in input order."""
+        mock_search = MagicMock()
+        mock_search.search_or_cached.side_effect = lambda term: [
+            _make_product(product_id=term, name=term)
+        ]
+        mock_selector = MagicMock()
+        mock_selector.select_product.side_effect = lambda item, candidates: (
+            _MockSelectionResult(item=item, product=candidates[0], reasoning="")
+        )
+        builder = CartBuilder(
+            search_service=mock_search,
+            product_selector=mock_selector,
+            substitution_service=MagicMock(),
+            safeway_client=MagicMock(store_id="1234", **{"get.return_value": {}}),
+        )
+        items = [_make_item(ingredient=f"i{n}", search_term=f"t{n}") for n in range(20)]
+
+        result = builder.build_cart(items)
+
+        assert [ci.safeway_product.product_id for ci in result.items] == [
+            f"t{n}" for n in range(20)
+        ]
+
+    def test_fulfillment_fetch_overlaps_item_processing(self) -> None:
+        """Test fulfillment options are requested while items are in flight."""
+        fulfillment_requested = threading.Event()
+        builder = self._make_builder()
+        builder._client.get.side_effect = lambda path: fulfillment_requested.set() or {}
+
+        def search(term: str) -> list[SafewayProduct]:
+            assert fulfillment_requested.wait(timeout=5)
+            return []
+
+        builder._search.search_or_cached.side_effect = search
+        result = builder.build_cart([_make_item()])
+
+        assert len(result.failed_items) == 1
+
     def test_empty_cart(self) -> None:
         """Test building cart with no items."""
         builder = self._make_builder()
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from grocery_butler.claude_utils import (
+    _avoided_brand_pattern,
+    _cached_anthropic_client,
     extract_json_text,
     filter_avoided_brands,
     items_from_string,
+    iter_items_from_string,
     make_anthropic_client,
+    parse_claude_json,
 )
 from grocery_butler.models import (
     BrandMatchType,
@@ -17,6 +24,7 @@ from grocery_butler.models import (
     BrandPreferenceType,
     IngredientCategory,
     SafewayProduct,
+    ShoppingListItem,
     Unit,
 )
 
@@ -37,6 +45,32 @@ class TestExtractJsonText:
         """Test surrounding whitespace is stripped."""
         assert extract_json_text("  {}\n  ") == "{}"
 
+    def test_strips_fences_with_surrounding_whitespace(self):
+        """Test fences are stripped when wrapped in whitespace."""
+        raw = '\n  ```json\n  {"a": 1}  \n```\n\n'
+        assert extract_json_text(raw) == '{"a": 1}'
+
+    def test_strips_fence_with_uppercase_language_tag(self):
+        """Test any language tag on the opening fence is dropped."""
+        assert extract_json_text("```JSON\n[1, 2]\n```") == "[1, 2]"
+
+    def test_empty_fenced_block(self):
+        """Test an empty fenced block yields an empty string."""
+        assert extract_json_text("```json\n```") == ""
+
+
+class TestParseClaudeJson:
+    """Tests for parse_claude_json helper."""
+
+    def test_decodes_fenced_json(self):
+        """Test fenced JSON is stripped and decoded."""
+        assert parse_claude_json('```json\n{"a": [1, 2]}\n```') == {"a": [1, 2]}
+
+    def test_invalid_json_raises_decode_error(self):
+        """Test malformed JSON raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            parse_claude_json("not json")
+
 
 class TestFilterAvoidedBrands:
     """Tests for filter_avoided_brands helper."""
@@ -67,6 +101,105 @@ class TestFilterAvoidedBrands:
         assert len(result) == 1
         assert result[0].name == "Good Milk"
 
+    def test_filters_any_of_several_avoided(self):
+        """Test a product is dropped if it matches any avoided brand."""
+        products = [
+            SafewayProduct(product_id="1", name="BadBrand Milk", price=1.0, size=""),
+            SafewayProduct(product_id="2", name="Worse Co Eggs", price=2.0, size=""),
+            SafewayProduct(product_id="3", name="Good Milk", price=3.0, size=""),
+        ]
+        prefs = [
+            BrandPreference(
+                brand=brand,
+                preference_type=BrandPreferenceType.AVOID,
+                match_type=BrandMatchType.CATEGORY,
+                match_target="dairy",
+            )
+            for brand in ("badbrand", "WORSE CO")
+        ]
+        result = filter_avoided_brands(products, prefs)
+        assert [p.product_id for p in result] == ["3"]
+
+    def test_avoided_brand_is_literal_text(self):
+        """Test regex metacharacters in a brand name are matched literally."""
+        products = [
+            SafewayProduct(product_id="1", name="A.B Milk", price=1.0, size=""),
+            SafewayProduct(product_id="2", name="AxB Milk", price=2.0, size=""),
+        ]
+        prefs = [
+            BrandPreference(
+                brand="A.B",
+                preference_type=BrandPreferenceType.AVOID,
+                match_type=BrandMatchType.CATEGORY,
+                match_target="dairy",
+            )
+        ]
+        result = filter_avoided_brands(products, prefs)
+        assert [p.product_id for p in result] == ["2"]
+
+    def test_avoided_pattern_escapes_metacharacters(self):
+        """Test the multi-brand pattern matches brand names literally."""
+        pattern = _avoided_brand_pattern(frozenset({"a.b", "c+d"}))
+        assert pattern.search("a.b milk") is not None
+        assert pattern.search("axb milk") is None
+        assert pattern.search("ccd eggs") is None
+
+    def test_matches_casefolded_names(self):
+        """Test brands match product names regardless of case or folding."""
+        products = [
+            SafewayProduct(product_id="1", name="ACME Milk", price=1.0, size=""),
+            SafewayProduct(product_id="2", name="Strauss Eggs", price=2.0, size=""),
+            SafewayProduct(product_id="3", name="Good Milk", price=3.0, size=""),
+        ]
+        prefs = [
+            BrandPreference(
+                brand=brand,
+                preference_type=BrandPreferenceType.AVOID,
+                match_type=BrandMatchType.CATEGORY,
+                match_target="dairy",
+            )
+            for brand in ("acme", "STRAUß")
+        ]
+        result = filter_avoided_brands(products, prefs)
+        assert [p.product_id for p in result] == ["3"]
+
+    def test_matches_current_name_after_copy(self):
+        """Test a renamed product copy is matched on its new name."""
+        original = SafewayProduct(product_id="1", name="Good Milk", price=1.0, size="")
+        renamed = original.model_copy(update={"name": "BadBrand Milk"})
+        prefs = [
+            BrandPreference(
+                brand="badbrand",
+                preference_type=BrandPreferenceType.AVOID,
+                match_type=BrandMatchType.CATEGORY,
+                match_target="dairy",
+            )
+        ]
+        assert filter_avoided_brands([original, renamed], prefs) == [original]
+
+    def test_empty_products_skips_pattern(self):
+        """Test no pattern is built when there are no products."""
+        prefs = [
+            BrandPreference(
+                brand=brand,
+                preference_type=BrandPreferenceType.AVOID,
+                match_type=BrandMatchType.CATEGORY,
+                match_target="dairy",
+            )
+            for brand in ("badbrand", "worse co")
+        ]
+        with patch("grocery_butler.claude_utils._avoided_brand_pattern") as mock_pat:
+            assert filter_avoided_brands([], prefs) == []
+        mock_pat.assert_not_called()
+
+    def test_avoided_pattern_is_cached(self):
+        """Test the compiled pattern is reused for the same avoid set."""
+        _avoided_brand_pattern.cache_clear()
+        first = _avoided_brand_pattern(frozenset({"acme", "globex"}))
+        second = _avoided_brand_pattern(frozenset({"globex", "acme"}))
+        assert first is second
+        assert _avoided_brand_pattern.cache_info().hits == 1
+
 
 class TestMakeAnthropicClient:
     """Tests for make_anthropic_client helper."""
@@ -84,6 +217,34 @@ class TestMakeAnthropicClient:
                 make_anthropic_client("fake-key")
             assert "Anthropic client unavailable" in caplog.text
 
+    def test_reuses_client_per_api_key(self):
+        """Test repeat calls with the same key return the same client."""
+        fake_module = MagicMock()
+        fake_module.Anthropic.side_effect = lambda api_key: MagicMock()
+        _cached_anthropic_client.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"anthropic": fake_module}):
+                first = make_anthropic_client("reuse-key")
+                second = make_anthropic_client("reuse-key")
+                other = make_anthropic_client("other-key")
+        finally:
+            _cached_anthropic_client.cache_clear()
+        assert first is second
+        assert other is not first
+        assert fake_module.Anthropic.call_count == 2
+
+    def test_failure_is_not_cached(self):
+        """Test a failed construction is retried on the next call."""
+        fake_module = MagicMock()
+        _cached_anthropic_client.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"anthropic": None}):
+                assert make_anthropic_client("retry-key") is None
+            with patch.dict("sys.modules", {"anthropic": fake_module}):
+                assert make_anthropic_client("retry-key") is not None
+        finally:
+            _cached_anthropic_client.cache_clear()
+
 
 class TestItemsFromString:
     """Tests for items_from_string helper."""
@@ -120,3 +281,21 @@ class TestItemsFromString:
         result = items_from_string("MILK, Eggs")
         assert result[0].ingredient == "milk"
         assert result[1].ingredient == "eggs"
+
+    def test_iter_items_is_lazy(self):
+        """Test the generator variant yields items one at a time."""
+        gen = iter_items_from_string("milk, , eggs")
+        assert next(gen).ingredient == "milk"
+        assert next(gen).ingredient == "eggs"
+        assert next(gen, None) is None
+
+    def test_items_do_not_share_from_meals(self):
+        """Test each item gets its own from_meals list."""
+        first, second = items_from_string("milk, eggs")
+        first.from_meals.append("tacos")
+        assert second.from_meals == ["manual"]
+
+    def test_items_match_validated_model(self):
+        """Test unvalidated items equal their fully validated equivalents."""
+        item = items_from_string("Milk")[0]
+        assert ShoppingListItem.model_validate(item.model_dump()) == item
@@ -8,18 +8,23 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from grocery_butler.cli import (
+    _HANDLERS,
+    _SUBPARSER_BUILDERS,
     _build_parser,
+    _category_display,
     _forget_recipe,
     _format_cart_summary,
     _format_inventory,
     _format_items_by_category,
     _format_pantry_staples,
     _format_quantity,
+    _format_recipe_detail,
     _format_recipes,
     _format_shopping_list,
     _handle_bot,
     _handle_order,
     _remove_pantry_staple,
+    _split_csv,
     main,
 )
 from grocery_butler.models import (
@@ -144,6 +149,18 @@ def mock_config() -> MagicMock:
 # ---------------------------------------------------------------------------
 
 
+class TestSplitCsv:
+    """Tests for _split_csv helper."""
+
+    def test_strips_and_drops_empty(self):
+        """Test names are stripped and blank entries skipped."""
+        assert _split_csv(" tacos, ,pasta ,") == ["tacos", "pasta"]
+
+    def test_blank_input(self):
+        """Test a blank string yields no names."""
+        assert _split_csv("  ") == []
+
+
 class TestFormatQuantity:
     """Tests for _format_quantity helper."""
 
@@ -286,6 +303,47 @@ class TestFormatItemsByCategory:
         result = _format_items_by_category(items)
         assert "mystery item" in result
 
+    def test_groups_and_sorts_interleaved_items(self):
+        """Test categories and ingredients are sorted from unordered input."""
+        items = [
+            ShoppingListItem(
+                ingredient=name,
+                quantity=1.0,
+                unit="each",
+                category=category,
+                search_term=name,
+                from_meals=["Test"],
+            )
+            for name, category in [
+                ("steak", IngredientCategory.MEAT),
+                ("milk", IngredientCategory.DAIRY),
+                ("bacon", IngredientCategory.MEAT),
+                ("butter", IngredientCategory.DAIRY),
+            ]
+        ]
+        result = _format_items_by_category(items)
+        assert result == (
+            "[Dairy]\n"
+            "       1 each     butter\n"
+            "       1 each     milk\n"
+            "\n"
+            "[Meat & Seafood]\n"
+            "       1 each     bacon\n"
+            "       1 each     steak"
+        )
+
+
+class TestCategoryDisplay:
+    """Tests for _category_display."""
+
+    def test_known_category(self):
+        """Test known keys use the display table."""
+        assert _category_display("meat") == "Meat & Seafood"
+
+    def test_unknown_category_is_title_cased(self):
+        """Test unknown keys fall back to a title-cased heading."""
+        assert _category_display("household_goods") == "Household Goods"
+
 
 class TestFormatInventory:
     """Tests for _format_inventory."""
@@ -341,6 +399,22 @@ class TestFormatRecipes:
         assert "5" in result
 
 
+class TestFormatRecipeDetail:
+    """Tests for _format_recipe_detail."""
+
+    def test_sections_in_order(self, sample_meal: ParsedMeal):
+        """Test header, purchase and pantry sections render in order."""
+        lines = _format_recipe_detail(sample_meal).splitlines()
+        assert lines[:4] == [
+            "Recipe: Chicken Tacos (4 servings)",
+            "Purchase items:",
+            "  2 lb chicken thighs",
+            "  12 each corn tortillas",
+        ]
+        assert lines[4] == "Pantry items:"
+        assert len(lines) == 5 + len(sample_meal.pantry_items)
+
+
 class TestFormatPantryStaples:
     """Tests for _format_pantry_staples."""
 
@@ -482,6 +556,19 @@ class TestBuildParser:
         args = parser.parse_args([])
         assert args.command is None
 
+    def test_only_registers_single_subcommand(self):
+        """Test only= builds just the named subcommand."""
+        parser = _build_parser("restock")
+        assert parser.parse_args(["restock", "clear"]).action == "clear"
+        with pytest.raises(SystemExit):
+            parser.parse_args(["plan", "pasta"])
+
+    def test_unknown_only_registers_all(self):
+        """Test an unknown only= value falls back to the full parser."""
+        parser = _build_parser("--help")
+        assert parser.parse_args(["bot"]).command == "bot"
+        assert parser.parse_args(["pantry"]).command == "pantry"
+
 
 # ---------------------------------------------------------------------------
 # Stock subcommand handler tests
@@ -629,7 +716,7 @@ class TestHandleStock:
         """Test stock works with no config using default path."""
         with (
             patch("grocery_butler.cli._load_config_safe") as mock_cfg,
-            patch("grocery_butler.cli.PantryManager") as mock_pm_cls,
+            patch("grocery_butler.pantry_manager.PantryManager") as mock_pm_cls,
         ):
             mock_cfg.return_value = None
             mock_pm = MagicMock()
@@ -1023,9 +1110,9 @@ class TestHandlePlan:
         with (
             patch("grocery_butler.cli._load_config_safe") as mock_cfg,
             patch("grocery_butler.cli._make_anthropic_client") as mock_client_fn,
-            patch("grocery_butler.cli.MealParser") as mock_parser_cls,
-            patch("grocery_butler.cli.Consolidator") as mock_cons_cls,
-            patch("grocery_butler.cli.PantryManager") as mock_pm_cls,
+            patch("grocery_butler.meal_parser.MealParser") as mock_parser_cls,
+            patch("grocery_butler.consolidator.Consolidator") as mock_cons_cls,
+            patch("grocery_butler.pantry_manager.PantryManager") as mock_pm_cls,
         ):
             cfg = MagicMock()
             cfg.anthropic_api_key = "test"
@@ -1070,7 +1157,7 @@ class TestHandlePlan:
             mock_cons_cls.return_value = mock_consolidator
 
             mock_pm = MagicMock()
-            mock_pm.get_restock_queue.return_value = []
+            mock_pm.get_restock_and_staples.return_value = ([], [])
             mock_pm_cls.return_value = mock_pm
 
             from grocery_butler.cli import _handle_plan
@@ -1089,7 +1176,7 @@ class TestHandlePlan:
         with (
             patch("grocery_butler.cli._load_config_safe") as mock_cfg,
             patch("grocery_butler.cli._make_anthropic_client") as mock_client_fn,
-            patch("grocery_butler.cli.MealParser") as mock_parser_cls,
+            patch("grocery_butler.meal_parser.MealParser") as mock_parser_cls,
         ):
             cfg = MagicMock()
             cfg.anthropic_api_key = "test"
@@ -1118,9 +1205,9 @@ class TestHandlePlan:
         with (
             patch("grocery_butler.cli._load_config_safe") as mock_cfg,
             patch("grocery_butler.cli._make_anthropic_client") as mock_client_fn,
-            patch("grocery_butler.cli.MealParser") as mock_parser_cls,
-            patch("grocery_butler.cli.Consolidator") as mock_cons_cls,
-            patch("grocery_butler.cli.PantryManager") as mock_pm_cls,
+            patch("grocery_butler.meal_parser.MealParser") as mock_parser_cls,
+            patch("grocery_butler.consolidator.Consolidator") as mock_cons_cls,
+            patch("grocery_butler.pantry_manager.PantryManager") as mock_pm_cls,
         ):
             cfg = MagicMock()
             cfg.anthropic_api_key = "test"
@@ -1139,7 +1226,7 @@ class TestHandlePlan:
             mock_cons_cls.return_value = mock_consolidator
 
             mock_pm = MagicMock()
-            mock_pm.get_restock_queue.return_value = []
+            mock_pm.get_restock_and_staples.return_value = ([], [])
             mock_pm_cls.return_value = mock_pm
 
             from grocery_butler.cli import _handle_plan
@@ -1157,9 +1244,9 @@ class TestHandlePlan:
         with (
             patch("grocery_butler.cli._load_config_safe") as mock_cfg,
             patch("grocery_butler.cli._make_anthropic_client") as mock_client_fn,
-            patch("grocery_butler.cli.MealParser") as mock_parser_cls,
-            patch("grocery_butler.cli.Consolidator") as mock_cons_cls,
-            patch("grocery_butler.cli.PantryManager") as mock_pm_cls,
+            patch("grocery_butler.meal_parser.MealParser") as mock_parser_cls,
+            patch("grocery_butler.consolidator.Consolidator") as mock_cons_cls,
+            patch("grocery_butler.pantry_manager.PantryManager") as mock_pm_cls,
         ):
             cfg = MagicMock()
             cfg.anthropic_api_key = "test"
@@ -1178,7 +1265,7 @@ class TestHandlePlan:
             mock_cons_cls.return_value = mock_consolidator
 
             mock_pm = MagicMock()
-            mock_pm.get_restock_queue.return_value = []
+            mock_pm.get_restock_and_staples.return_value = ([], [])
             mock_pm_cls.return_value = mock_pm
 
             from grocery_butler.cli import _handle_plan
@@ -1260,6 +1347,20 @@ class TestMain:
             main([])
         assert exc_info.value.code == 0
 
+    def test_every_subcommand_has_a_handler(self):
+        """Test the parser table and the dispatch table stay in sync."""
+        assert list(_HANDLERS) == list(_SUBPARSER_BUILDERS)
+
+    def test_builds_only_requested_subparser(self):
+        """Test main passes the subcommand name to _build_parser."""
+        with (
+            patch("grocery_butler.cli._build_parser", wraps=_build_parser) as mock_bp,
+            patch.dict("grocery_butler.cli._HANDLERS", {"restock": lambda _args: 0}),
+            pytest.raises(SystemExit),
+        ):
+            main(["restock"])
+        mock_bp.assert_called_once_with("restock")
+
     def test_stock_command(self, db_path: str, capsys):
         """Test main dispatches stock command."""
         with (
@@ -1323,6 +1424,19 @@ class TestForgetRecipe:
         captured = capsys.readouterr()
         assert "deleted" in captured.out.lower()
 
+    def test_forget_prefers_exact_over_substring(
+        self, db_path: str, sample_meal: ParsedMeal, capsys
+    ):
+        """Test an exact match wins over an earlier substring match."""
+        store = RecipeStore(db_path)
+        store.save_recipe(sample_meal)
+        store.save_recipe(sample_meal.model_copy(update={"name": "Tacos"}))
+
+        code = _forget_recipe(store, "tacos")
+        assert code == 0
+        names = [str(r["display_name"]) for r in store.list_recipes()]
+        assert names == [sample_meal.name]
+
     def test_forget_not_found(self, db_path: str, capsys):
         """Test deletion of non-existent recipe."""
         store = RecipeStore(db_path)
@@ -1448,7 +1562,7 @@ class TestHandleOrder:
         with (
             patch("grocery_butler.cli._load_config_safe", return_value=cfg),
             patch("grocery_butler.cli._make_anthropic_client", return_value=None),
-            patch("grocery_butler.cli.SafewayPipeline"),
+            patch("grocery_butler.safeway_pipeline.SafewayPipeline"),
         ):
             parser = _build_parser()
             args = parser.parse_args(["order"])
@@ -1505,7 +1619,9 @@ class TestHandleOrder:
         with (
             patch("grocery_butler.cli._load_config_safe", return_value=cfg),
             patch("grocery_butler.cli._make_anthropic_client", return_value=None),
-            patch("grocery_butler.cli.SafewayPipeline") as mock_pipeline_cls,
+            patch(
+                "grocery_butler.safeway_pipeline.SafewayPipeline"
+            ) as mock_pipeline_cls,
         ):
             mock_pipeline = MagicMock()
             mock_pipeline.build_cart_only.return_value = cart
@@ -1547,7 +1663,9 @@ class TestHandleOrder:
         with (
             patch("grocery_butler.cli._load_config_safe", return_value=cfg),
             patch("grocery_butler.cli._make_anthropic_client", return_value=None),
-            patch("grocery_butler.cli.SafewayPipeline") as mock_pipeline_cls,
+            patch(
+                "grocery_butler.safeway_pipeline.SafewayPipeline"
+            ) as mock_pipeline_cls,
         ):
             mock_pipeline = MagicMock()
             mock_pipeline.run.return_value = result
@@ -1581,7 +1699,9 @@ class TestHandleOrder:
         with (
             patch("grocery_butler.cli._load_config_safe", return_value=cfg),
             patch("grocery_butler.cli._make_anthropic_client", return_value=None),
-            patch("grocery_butler.cli.SafewayPipeline") as mock_pipeline_cls,
+            patch(
+                "grocery_butler.safeway_pipeline.SafewayPipeline"
+            ) as mock_pipeline_cls,
         ):
             mock_pipeline = MagicMock()
             mock_pipeline.run.return_value = result
@@ -1595,6 +1715,39 @@ class TestHandleOrder:
         captured = capsys.readouterr()
         assert "Payment declined" in captured.err
 
+    def test_meals_reuse_order_client(self):
+        """Test --meals reuses the pipeline's client, store and pantry."""
+        cfg = MagicMock()
+        cfg.anthropic_api_key = "sk-test"
+        cfg.database_path = ":memory:"
+        client = MagicMock()
+
+        with (
+            patch("grocery_butler.cli._load_config_safe", return_value=cfg),
+            patch(
+                "grocery_butler.cli._make_anthropic_client", return_value=client
+            ) as mock_client_fn,
+            patch(
+                "grocery_butler.safeway_pipeline.SafewayPipeline"
+            ) as mock_pipeline_cls,
+            patch("grocery_butler.meal_parser.MealParser") as mock_parser_cls,
+            patch("grocery_butler.consolidator.Consolidator") as mock_cons_cls,
+            patch("grocery_butler.pantry_manager.PantryManager") as mock_pm_cls,
+            patch("grocery_butler.cli._format_cart_summary", return_value=""),
+        ):
+            mock_cons_cls.return_value.consolidate.return_value = []
+            mock_pm_cls.return_value.get_restock_and_staples.return_value = ([], [])
+            parser = _build_parser()
+            args = parser.parse_args(["order", "--dry-run", "--meals", "tacos"])
+            _handle_order(args)
+
+        mock_client_fn.assert_called_once_with("sk-test")
+        assert mock_parser_cls.call_args.kwargs["anthropic_client"] is client
+        pipeline_kwargs = mock_pipeline_cls.call_args.kwargs
+        assert mock_parser_cls.call_args.args[0] is pipeline_kwargs["recipe_store"]
+        assert pipeline_kwargs["pantry_manager"] is mock_pm_cls.return_value
+        mock_pm_cls.assert_called_once()
+
     def test_parser_accepts_order_flags(self):
         """Test argparse wiring for order subcommand."""
         parser = _build_parser()
@@ -11,7 +11,13 @@ import pytest
 if TYPE_CHECKING:
     from pathlib import Path
 
-from grocery_butler.config import Config, ConfigError, load_config
+from grocery_butler.config import (
+    _INT_FIELDS,
+    _STR_FIELDS,
+    Config,
+    ConfigError,
+    load_config,
+)
 
 
 class TestConfig:
@@ -27,6 +33,7 @@ class TestConfig:
         assert cfg.flask_debug is False
         assert cfg.default_servings == 4
         assert cfg.default_units == "imperial"
+        assert cfg.thread_pool_size == 64
 
     def test_config_all_fields(self) -> None:
         """Test Config accepts all fields."""
@@ -203,3 +210,45 @@ class TestLoadConfig:
         """Test database_url defaults to empty string when not set."""
         cfg = load_config()
         assert cfg.database_url == ""
+
+    @patch.dict(
+        os.environ,
+        {"ANTHROPIC_API_KEY": "sk-test", "THREAD_POOL_SIZE": "128"},
+        clear=True,
+    )
+    def test_load_config_thread_pool_size(self) -> None:
+        """Test load_config reads THREAD_POOL_SIZE."""
+        cfg = load_config()
+        assert cfg.thread_pool_size == 128
+
+    @patch.dict(
+        os.environ,
+        {"ANTHROPIC_API_KEY": "sk-test", "THREAD_POOL_SIZE": "0"},
+        clear=True,
+    )
+    def test_load_config_thread_pool_size_too_small_raises(self) -> None:
+        """Test load_config rejects a THREAD_POOL_SIZE below 1."""
+        with pytest.raises(ConfigError, match="THREAD_POOL_SIZE must be at least 1"):
+            load_config()
+
+    def test_field_tables_cover_config(self) -> None:
+        """Test every Config field is read by load_config."""
+        from dataclasses import fields
+
+        table_attrs = {attr for attr, _, _ in (*_STR_FIELDS, *_INT_FIELDS)}
+        expected = {f.name for f in fields(Config)} - {
+            "anthropic_api_key",
+            "flask_debug",
+        }
+        assert table_attrs == expected
+
+    @patch.dict(
+        os.environ,
+        {"ANTHROPIC_API_KEY": "sk-test", "SAFEWAY_STORE_ID": "1234"},
+        clear=True,
+    )
+    def test_load_config_string_field_from_env(self) -> None:
+        """Test table-driven string fields read their environment variable."""
+        cfg = load_config()
+        assert cfg.safeway_store_id == "1234"
+        assert cfg.database_path == "mealbot.db"
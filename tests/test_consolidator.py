@@ -11,10 +11,10 @@ from grocery_butler.claude_utils import extract_json_text
 from grocery_butler.consolidator import (
     Consolidator,
     _build_ingredient_text,
-    _flatten_meal_ingredients,
     _format_inventory_overrides,
     _format_pantry_staples,
     _format_restock_queue,
+    _MergedIngredient,
     _parse_response_items,
     _parse_shopping_item,
 )
@@ -25,6 +25,7 @@ from grocery_butler.models import (
     InventoryStatus,
     ParsedMeal,
     ShoppingListItem,
+    Unit,
 )
 
 # ---------------------------------------------------------------------------
@@ -321,6 +322,26 @@ class TestFormatRestockQueue:
         assert "Sponges" in result
         assert "qty:" not in result
 
+    def test_entry_format(self):
+        """Test each entry is one bullet line with status and quantity."""
+        queue = [
+            InventoryItem(
+                ingredient="milk",
+                display_name="Milk",
+                status=InventoryStatus.LOW,
+                default_quantity=1.0,
+                default_unit="gal",
+            ),
+            InventoryItem(
+                ingredient="sponges",
+                display_name="Sponges",
+                status=InventoryStatus.OUT,
+            ),
+        ]
+        assert _format_restock_queue(queue) == (
+            "- Milk (status: low)   qty: 1.0 gal\n- Sponges (status: out)"
+        )
+
 
 class TestFormatInventoryOverrides:
     """Tests for _format_inventory_overrides helper."""
@@ -477,36 +498,6 @@ class TestParseResponseItems:
         assert len(result) == 1
 
 
-class TestFlattenMealIngredients:
-    """Tests for _flatten_meal_ingredients helper."""
-
-    def test_flattens_single_meal(self, sample_tacos_meal: ParsedMeal):
-        """Test flattening a single meal's ingredients."""
-        result = _flatten_meal_ingredients([sample_tacos_meal])
-        assert len(result) == 3
-        ingredients = [r[0] for r in result]
-        assert "chicken thighs" in ingredients
-        assert "corn tortillas" in ingredients
-
-    def test_flattens_multiple_meals(
-        self,
-        sample_tacos_meal: ParsedMeal,
-        sample_tikka_meal: ParsedMeal,
-    ):
-        """Test flattening multiple meals' ingredients."""
-        result = _flatten_meal_ingredients([sample_tacos_meal, sample_tikka_meal])
-        assert len(result) == 6
-
-    def test_empty_meals_list(self):
-        """Test empty meals list returns empty."""
-        assert _flatten_meal_ingredients([]) == []
-
-    def test_includes_meal_name(self, sample_tacos_meal: ParsedMeal):
-        """Test each tuple includes the meal name."""
-        result = _flatten_meal_ingredients([sample_tacos_meal])
-        assert all(r[4] == "Chicken Tacos" for r in result)
-
-
 class TestBuildIngredientText:
     """Tests for _build_ingredient_text helper."""
 
@@ -789,6 +780,36 @@ class TestConsolidateWithClaude:
         call_kwargs = mock_client.messages.create.call_args
         assert call_kwargs[1]["model"] == "claude-sonnet-4-6"
 
+    def test_empty_plan_skips_claude(self, mock_client: MagicMock):
+        """Test no meals and no restock returns [] without calling Claude."""
+        consolidator = Consolidator(anthropic_client=mock_client)
+        assert consolidator.consolidate([], [], []) == []
+        mock_client.messages.create.assert_not_called()
+
+    def test_restock_only_skips_claude(
+        self,
+        mock_client: MagicMock,
+        sample_restock_queue: list[InventoryItem],
+    ):
+        """Test a restock-only plan is built locally."""
+        consolidator = Consolidator(anthropic_client=mock_client)
+        result = consolidator.consolidate([], sample_restock_queue, [])
+        mock_client.messages.create.assert_not_called()
+        assert result == Consolidator._build_restock_items(sample_restock_queue)
+
+    def test_overrides_still_call_claude(
+        self,
+        mock_client: MagicMock,
+        sample_restock_queue: list[InventoryItem],
+    ):
+        """Test inventory overrides keep the Claude path even without meals."""
+        mock_client.messages.create.return_value = _make_claude_response(
+            _valid_consolidation_json()
+        )
+        consolidator = Consolidator(anthropic_client=mock_client)
+        consolidator.consolidate([], sample_restock_queue, [], ["salt"])
+        mock_client.messages.create.assert_called_once()
+
     def test_no_client_uses_simple_fallback(
         self,
         sample_tacos_meal: ParsedMeal,
@@ -1068,9 +1089,27 @@ class TestMergeAndBuildHelpers:
             set(),
         )
         assert "lime" in merged
-        raw_qty = merged["lime"].get("quantity", 0.0)
-        qty = float(raw_qty) if isinstance(raw_qty, (int, float)) else 0.0
-        assert qty == 3.0
+        assert merged["lime"].quantity == 3.0
+        assert merged["lime"].from_meals == [
+            sample_tacos_meal.name,
+            sample_tikka_meal.name,
+        ]
+
+    def test_merge_lists_each_meal_once(
+        self,
+        sample_tacos_meal: ParsedMeal,
+        sample_tikka_meal: ParsedMeal,
+    ):
+        """Test a meal repeated in the plan is listed once per ingredient."""
+        merged = Consolidator._merge_meal_ingredients(
+            [sample_tacos_meal, sample_tikka_meal, sample_tacos_meal],
+            set(),
+        )
+        assert merged["lime"].quantity == 5.0
+        assert merged["lime"].from_meals == [
+            sample_tacos_meal.name,
+            sample_tikka_meal.name,
+        ]
 
     def test_merge_excludes_pantry(self, sample_tacos_meal: ParsedMeal):
         """Test pantry items excluded from merged result."""
@@ -1105,19 +1144,21 @@ class TestMergeAndBuildHelpers:
 
     def test_build_items_from_merged(self):
         """Test _build_items_from_merged produces ShoppingListItem list."""
-        merged: dict[str, dict[str, object]] = {
-            "chicken": {
-                "ingredient": "chicken",
-                "quantity": 2.0,
-                "unit": "lbs",
-                "category": "meat",
-                "from_meals": ["Tacos"],
-            },
+        merged = {
+            "chicken": _MergedIngredient(
+                ingredient="chicken",
+                quantity=2.0,
+                unit=Unit.LB,
+                category=IngredientCategory.MEAT,
+                from_meals=["Tacos"],
+            ),
         }
         result = Consolidator._build_items_from_merged(merged)
         assert len(result) == 1
         assert result[0].ingredient == "chicken"
         assert result[0].search_term == "chicken"
+        assert result[0].unit == Unit.LB
+        assert result[0].category == IngredientCategory.MEAT
 
     def test_build_restock_items(self, sample_restock_queue: list[InventoryItem]):
         """Test _build_restock_items filters to low/out status."""
@@ -16,6 +16,7 @@ from grocery_butler.db import (
     SCHEMA_PATH,
     get_connection,
     init_db,
+    reset_memory_db,
 )
 from grocery_butler.db.adapter import (
     DatabaseConnection,
@@ -256,3 +257,40 @@ class TestInitDb:
                 )
         finally:
             conn.close()
+
+
+class TestResetMemoryDb:
+    """Tests for reset_memory_db function."""
+
+    def test_memory_db_persists_until_reset(self) -> None:
+        """Test the shared in-memory DB survives until it is reset."""
+        reset_memory_db()
+        init_db(":memory:")
+        conn = get_connection(":memory:")
+        try:
+            conn.execute("DELETE FROM pantry_staples")
+            conn.commit()
+        finally:
+            conn.close()
+
+        init_db(":memory:")
+        conn = get_connection(":memory:")
+        try:
+            cursor = conn.execute("SELECT COUNT(*) as cnt FROM pantry_staples")
+            assert cursor.fetchone()["cnt"] == 0
+        finally:
+            conn.close()
+
+        reset_memory_db()
+        init_db(":memory:")
+        conn = get_connection(":memory:")
+        try:
+            cursor = conn.execute("SELECT COUNT(*) as cnt FROM pantry_staples")
+            assert cursor.fetchone()["cnt"] == len(DEFAULT_PANTRY)
+        finally:
+            conn.close()
+
+    def test_reset_without_memory_db_is_noop(self) -> None:
+        """Test resetting twice does not raise."""
+        reset_memory_db()
+        reset_memory_db()
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import json
+import threading
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -853,6 +854,69 @@ class TestMultipleMeals:
         assert results[0].known_recipe is True
         assert results[1].needs_confirmation is True
 
+    def test_prompt_inputs_read_once_per_batch(
+        self,
+        store: RecipeStore,
+        sample_meal: ParsedMeal,
+        mock_client: MagicMock,
+    ):
+        """Test store-backed prompt inputs are loaded once for all meals."""
+        store.save_recipe(sample_meal)
+        mock_client.messages.create.return_value = _make_claude_response("{}")
+        parser = MealParser(store, anthropic_client=mock_client)
+        with (
+            patch.object(store, "list_recipes", wraps=store.list_recipes) as list_spy,
+            patch.object(
+                store,
+                "get_pantry_staple_names",
+                wraps=store.get_pantry_staple_names,
+            ) as pantry_spy,
+        ):
+            results = parser.parse_meals(["Dish A", "Dish B", "Dish C"])
+
+        assert len(results) == 3
+        assert list_spy.call_count == 1
+        assert pantry_spy.call_count == 1
+
+    def test_repeated_meal_resolved_once(
+        self, store: RecipeStore, mock_client: MagicMock
+    ):
+        """Test a meal named twice in one plan costs one resolution."""
+        parser = MealParser(store, anthropic_client=mock_client)
+        with patch.object(
+            parser,
+            "_resolve_single_meal",
+            side_effect=lambda name, servings, context: _build_stub_meal(
+                name, servings
+            ),
+        ) as resolve:
+            results = parser.parse_meals(["Tacos", "Pasta", "Tacos"])
+
+        assert [r.name for r in results] == ["Tacos", "Pasta", "Tacos"]
+        assert resolve.call_count == 2
+
+    def test_results_keep_input_order(self, store: RecipeStore):
+        """Test concurrently resolved meals come back in input order."""
+        names = [f"Dish {i}" for i in range(12)]
+        parser = MealParser(store)
+        results = parser.parse_meals(names)
+
+        assert [r.name for r in results] == names
+
+    def test_meals_resolved_concurrently(self, store: RecipeStore):
+        """Test several meals are in flight at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+        parser = MealParser(store)
+
+        def _resolve(name: str, servings: int, context: object) -> ParsedMeal:
+            barrier.wait()
+            return _build_stub_meal(name, servings)
+
+        with patch.object(parser, "_resolve_single_meal", side_effect=_resolve):
+            results = parser.parse_meals(["A", "B", "C"])
+
+        assert [r.name for r in results] == ["A", "B", "C"]
+
 
 class TestConfigurationHelpers:
     """Tests for configuration helper methods."""
@@ -151,6 +151,13 @@ class TestDiscoverMigrations:
         for _, _, path in migrations:
             assert path.name.endswith("_pg.sql")
 
+    def test_directory_scanned_once_per_dialect(self) -> None:
+        """Test repeat discovery reuses the first scan."""
+        _discover_migrations.cache_clear()
+        first = _discover_migrations(is_pg=False)
+        assert _discover_migrations(is_pg=False) is first
+        assert _discover_migrations(is_pg=True) is not first
+
 
 # ---------------------------------------------------------------------------
 # _record_migration
@@ -267,15 +274,19 @@ class TestMigrate:
         (fake_dir / "001_bad.sql").write_text("CREATE TABL broken_syntax;")
 
         db_path = str(tmp_path / "bad.db")
-        with (
-            patch.object(
-                type(MIGRATIONS_DIR),
-                "iterdir",
-                return_value=iter(sorted(fake_dir.iterdir())),
-            ),
-            pytest.raises(Exception, match=r".+"),
-        ):
-            migrate(db_path)
+        _discover_migrations.cache_clear()
+        try:
+            with (
+                patch.object(
+                    type(MIGRATIONS_DIR),
+                    "iterdir",
+                    return_value=iter(sorted(fake_dir.iterdir())),
+                ),
+                pytest.raises(Exception, match=r".+"),
+            ):
+                migrate(db_path)
+        finally:
+            _discover_migrations.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -4,14 +4,20 @@ from __future__ import annotations
 
 import argparse
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+    from grocery_butler.db.adapter import DatabaseConnection
+
 from grocery_butler.db import get_connection, init_db
 from grocery_butler.db.migrate_unit_enum import (
+    _UPDATE_CHUNK_SIZE,
+    _apply_unit_updates,
     _build_parser,
     _migrate_household_inventory,
     _migrate_recipe_ingredients,
@@ -145,6 +151,25 @@ def _fetch_inventory_default_unit(db_path: str, row_id: int) -> str | None:
         conn.close()
 
 
+def _run_step(step: Callable[[DatabaseConnection], int], db_path: str) -> int:
+    """Run one migration step on its own connection and commit it.
+
+    Args:
+        step: Migration helper taking an open connection.
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        Number of rows the step updated.
+    """
+    conn = get_connection(db_path)
+    try:
+        count = step(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    return count
+
+
 # ---------------------------------------------------------------------------
 # Tests for _migrate_recipe_ingredients
 # ---------------------------------------------------------------------------
@@ -160,7 +185,7 @@ class TestMigrateRecipeIngredients:
         recipe_id = _seed_recipe(db_path)
         row_id = _seed_recipe_ingredient(db_path, recipe_id, "lbs")
 
-        count = _migrate_recipe_ingredients(db_path)
+        count = _run_step(_migrate_recipe_ingredients, db_path)
 
         assert count == 1
         assert _fetch_recipe_ingredient_unit(db_path, row_id) == Unit.LB.value
@@ -172,10 +197,22 @@ class TestMigrateRecipeIngredients:
         recipe_id = _seed_recipe(db_path)
         _seed_recipe_ingredient(db_path, recipe_id, "lb")
 
-        count = _migrate_recipe_ingredients(db_path)
+        count = _run_step(_migrate_recipe_ingredients, db_path)
 
         assert count == 0
 
+    def test_non_canonical_case_normalized(self, tmp_path: Path) -> None:
+        """Test a valid unit in the wrong case is still rewritten."""
+        db_path = str(tmp_path / "test.db")
+        init_db(db_path)
+        recipe_id = _seed_recipe(db_path)
+        row_id = _seed_recipe_ingredient(db_path, recipe_id, "LB")
+
+        count = _run_step(_migrate_recipe_ingredients, db_path)
+
+        assert count == 1
+        assert _fetch_recipe_ingredient_unit(db_path, row_id) == Unit.LB.value
+
     def test_multiple_rows_partially_migrated(self, tmp_path: Path) -> None:
         """Test that only non-normalized rows are counted."""
         db_path = str(tmp_path / "test.db")
@@ -184,7 +221,7 @@ class TestMigrateRecipeIngredients:
         _seed_recipe_ingredient(db_path, recipe_id, "lb")
         _seed_recipe_ingredient(db_path, recipe_id, "pounds")
 
-        count = _migrate_recipe_ingredients(db_path)
+        count = _run_step(_migrate_recipe_ingredients, db_path)
 
         assert count == 1
 
@@ -193,7 +230,7 @@ class TestMigrateRecipeIngredients:
         db_path = str(tmp_path / "test.db")
         init_db(db_path)
 
-        count = _migrate_recipe_ingredients(db_path)
+        count = _run_step(_migrate_recipe_ingredients, db_path)
 
         assert count == 0
 
@@ -212,7 +249,7 @@ class TestMigrateHouseholdInventory:
         init_db(db_path)
         row_id = _seed_inventory_item(db_path, "milk", "gallon")
 
-        count = _migrate_household_inventory(db_path)
+        count = _run_step(_migrate_household_inventory, db_path)
 
         assert count == 1
         assert _fetch_inventory_default_unit(db_path, row_id) == Unit.GAL.value
@@ -223,7 +260,7 @@ class TestMigrateHouseholdInventory:
         init_db(db_path)
         row_id = _seed_inventory_item(db_path, "salt", None)
 
-        count = _migrate_household_inventory(db_path)
+        count = _run_step(_migrate_household_inventory, db_path)
 
         assert count == 0
         assert _fetch_inventory_default_unit(db_path, row_id) is None
@@ -234,7 +271,7 @@ class TestMigrateHouseholdInventory:
         init_db(db_path)
         _seed_inventory_item(db_path, "oil", "bottle")
 
-        count = _migrate_household_inventory(db_path)
+        count = _run_step(_migrate_household_inventory, db_path)
 
         assert count == 0
 
@@ -243,11 +280,47 @@ class TestMigrateHouseholdInventory:
         db_path = str(tmp_path / "test.db")
         init_db(db_path)
 
-        count = _migrate_household_inventory(db_path)
+        count = _run_step(_migrate_household_inventory, db_path)
 
         assert count == 0
 
 
+# ---------------------------------------------------------------------------
+# Tests for _apply_unit_updates
+# ---------------------------------------------------------------------------
+
+
+class TestApplyUnitUpdates:
+    """Tests for the grouped IN-list UPDATE helper."""
+
+    def test_updates_span_multiple_chunks(self, tmp_path: Path) -> None:
+        """Test id lists longer than one chunk are fully applied."""
+        db_path = str(tmp_path / "test.db")
+        init_db(db_path)
+        recipe_id = _seed_recipe(db_path)
+        n_rows = _UPDATE_CHUNK_SIZE + 3
+        ids = [
+            _seed_recipe_ingredient(db_path, recipe_id, "lbs") for _ in range(n_rows)
+        ]
+        cup_id = _seed_recipe_ingredient(db_path, recipe_id, "cups")
+
+        conn = get_connection(db_path)
+        try:
+            count = _apply_unit_updates(
+                conn,
+                "UPDATE recipe_ingredients SET unit = ? WHERE id IN ({ids})",
+                {Unit.LB.value: ids, Unit.CUP.value: [cup_id]},
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        assert count == n_rows + 1
+        assert _fetch_recipe_ingredient_unit(db_path, ids[0]) == Unit.LB.value
+        assert _fetch_recipe_ingredient_unit(db_path, ids[-1]) == Unit.LB.value
+        assert _fetch_recipe_ingredient_unit(db_path, cup_id) == Unit.CUP.value
+
+
 # ---------------------------------------------------------------------------
 # Tests for migrate (integration)
 # ---------------------------------------------------------------------------
@@ -283,6 +356,24 @@ class TestMigrate:
 
         assert _fetch_recipe_ingredient_unit(db_path, ri_id) == Unit.LB.value
 
+    def test_failure_leaves_both_tables_untouched(self, tmp_path: Path) -> None:
+        """Test a failing second step rolls back the first."""
+        db_path = str(tmp_path / "test.db")
+        init_db(db_path)
+        recipe_id = _seed_recipe(db_path)
+        ri_id = _seed_recipe_ingredient(db_path, recipe_id, "lbs")
+
+        with (
+            patch(
+                "grocery_butler.db.migrate_unit_enum._migrate_household_inventory",
+                side_effect=RuntimeError("boom"),
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            migrate(db_path)
+
+        assert _fetch_recipe_ingredient_unit(db_path, ri_id) == "lbs"
+
 
 # ---------------------------------------------------------------------------
 # Tests for CLI entry point
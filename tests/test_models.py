@@ -244,6 +244,15 @@ class TestParseUnit:
         assert parse_unit("foobar") == Unit.EACH
         assert parse_unit("xyz123") == Unit.EACH
 
+    def test_repeat_spellings_are_cached(self) -> None:
+        """Test a repeated raw string is answered from the cache."""
+        parse_unit.cache_clear()
+        assert parse_unit("pounds") == Unit.LB
+        assert parse_unit("pounds") == Unit.LB
+        info = parse_unit.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
 
 class TestCoerceUnit:
     """Tests for the _coerce_unit module-level helper."""
@@ -275,6 +275,34 @@ class TestStatusLifecycle:
         assert item is not None
         assert item.status == InventoryStatus.LOW
 
+    def test_update_status_bulk(self, manager: PantryManager) -> None:
+        """Test bulk update applies each status in one call."""
+        for name in ("milk", "eggs", "bread"):
+            manager.add_item(
+                InventoryItem(
+                    ingredient=name,
+                    display_name=name.title(),
+                    status=InventoryStatus.ON_HAND,
+                )
+            )
+
+        count = manager.update_status_bulk(
+            [
+                ("MILK", InventoryStatus.OUT),
+                ("eggs", InventoryStatus.LOW),
+                ("nonexistent", InventoryStatus.OUT),
+            ]
+        )
+
+        assert count == 2
+        assert manager.get_item("milk").status == InventoryStatus.OUT  # type: ignore[union-attr]
+        assert manager.get_item("eggs").status == InventoryStatus.LOW  # type: ignore[union-attr]
+        assert manager.get_item("bread").status == InventoryStatus.ON_HAND  # type: ignore[union-attr]
+
+    def test_update_status_bulk_empty(self, manager: PantryManager) -> None:
+        """Test bulk update with no pairs is a no-op."""
+        assert manager.update_status_bulk([]) == 0
+
 
 # ---------------------------------------------------------------------------
 # TestUpdateQuantity
@@ -502,6 +530,22 @@ class TestRestockQueue:
         assert "bread" in names
         assert "eggs" not in names
 
+    def test_get_restock_and_staples_matches_separate_queries(
+        self, manager: PantryManager, db_path: str
+    ) -> None:
+        """Test the combined read equals the two individual queries."""
+        from grocery_butler.recipe_store import RecipeStore
+
+        manager.add_item(InventoryItem(ingredient="milk", display_name="Milk"))
+        manager.update_status("milk", InventoryStatus.OUT)
+        store = RecipeStore(db_path)
+        store.add_pantry_staple("cumin", "pantry_dry")
+
+        restock, staples = manager.get_restock_and_staples()
+        assert restock == manager.get_restock_queue()
+        assert staples == store.get_pantry_staple_names()
+        assert "cumin" in staples
+
     def test_clear_restock_queue(self, manager: PantryManager) -> None:
         """Test clear_restock_queue resets all low/out items to on_hand."""
         items = [
@@ -874,6 +918,14 @@ class TestParseClaudeResponse:
         with pytest.raises(json.JSONDecodeError):
             _parse_claude_response("not json")
 
+    def test_fenced_json_accepted(self) -> None:
+        """Test a markdown-fenced response is decoded."""
+        body = json.dumps(
+            [{"ingredient": "milk", "new_status": "out", "confidence": 0.9}]
+        )
+        result = _parse_claude_response(f"```json\n{body}\n```")
+        assert [u.ingredient for u in result] == ["milk"]
+
     def test_non_array_raises(self) -> None:
         """Test non-array JSON raises ValueError."""
         with pytest.raises(ValueError, match="Expected a JSON array"):
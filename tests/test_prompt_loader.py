@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import pytest
 
-from grocery_butler.prompt_loader import PROMPTS_DIR, load_prompt
+from grocery_butler.prompt_loader import (
+    PROMPTS_DIR,
+    load_prompt,
+    load_prompt_template,
+)
 
 
 class TestLoadPrompt:
@@ -106,6 +110,23 @@ class TestLoadPrompt:
         with pytest.raises(FileNotFoundError, match="Prompt template not found"):
             load_prompt("this_does_not_exist")
 
+    def test_template_is_read_once(self) -> None:
+        """Test repeat loads reuse the cached template text."""
+        load_prompt_template.cache_clear()
+        first = load_prompt("recipe_matching", query="a", recipe_list="x")
+        second = load_prompt("recipe_matching", query="b", recipe_list="y")
+        assert "a" in first
+        assert "b" in second
+        info = load_prompt_template.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_missing_template_is_not_cached(self) -> None:
+        """Test a missing template raises on every load."""
+        for _ in range(2):
+            with pytest.raises(FileNotFoundError):
+                load_prompt_template("this_does_not_exist")
+
     def test_prompts_dir_exists(self) -> None:
         """Test that the prompts directory exists."""
         assert PROMPTS_DIR.exists()
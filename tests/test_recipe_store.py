@@ -224,6 +224,15 @@ class TestRecipeCRUD:
         assert result.purchase_items[0].ingredient == "chicken breast"
         assert len(result.pantry_items) == 0
 
+    def test_find_recipe_id(self, store: RecipeStore, sample_meal: ParsedMeal) -> None:
+        """Test find_recipe_id returns the ID for a normalized name match."""
+        recipe_id = store.save_recipe(sample_meal)
+        assert store.find_recipe_id(sample_meal.name.upper()) == recipe_id
+
+    def test_find_recipe_id_missing(self, store: RecipeStore) -> None:
+        """Test find_recipe_id returns None when no recipe matches."""
+        assert store.find_recipe_id("nonexistent") is None
+
     def test_delete_recipe(self, store: RecipeStore, sample_meal: ParsedMeal) -> None:
         """Test deleting a recipe removes it completely."""
         recipe_id = store.save_recipe(sample_meal)
@@ -510,6 +519,34 @@ class TestBrandPreferences:
 
         assert store.get_brand_preferences() == []
 
+    def test_remove_brand_preferences_for_target(self, store: RecipeStore) -> None:
+        """Test every preference for a target is removed, ignoring case."""
+        keep = BrandPreference(
+            match_target="eggs",
+            match_type=BrandMatchType.INGREDIENT,
+            brand="Vital Farms",
+            preference_type=BrandPreferenceType.PREFERRED,
+        )
+        store.add_brand_preference(keep)
+        for brand in ("Organic Valley", "Horizon"):
+            store.add_brand_preference(
+                BrandPreference(
+                    match_target="milk",
+                    match_type=BrandMatchType.INGREDIENT,
+                    brand=brand,
+                    preference_type=BrandPreferenceType.PREFERRED,
+                )
+            )
+
+        assert store.remove_brand_preferences_for_target("MILK") == 2
+        assert store.get_brand_preferences() == [keep]
+
+    def test_remove_brand_preferences_for_target_none_match(
+        self, store: RecipeStore
+    ) -> None:
+        """Test removing preferences for an unknown target removes nothing."""
+        assert store.remove_brand_preferences_for_target("milk") == 0
+
     def test_get_brands_for_ingredient_level(self, store: RecipeStore) -> None:
         """Test ingredient-level brand preference lookup."""
         pref = BrandPreference(
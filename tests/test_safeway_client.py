@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
@@ -466,6 +468,74 @@ class TestSafewayClientAutoAuth:
         assert len(transport.requests) == 3
         client.close()
 
+    def test_concurrent_refresh_authenticates_once(self) -> None:
+        """Test threads hitting an expired token trigger a single login."""
+        client = SafewayClient("user", "pass", "1234", http_client=httpx.Client())
+        client._token = TokenState(
+            access_token="stale",
+            expires_at=datetime.now(tz=UTC) - timedelta(hours=1),
+        )
+
+        def _refresh() -> None:
+            time.sleep(0.05)
+            client._token = TokenState(
+                access_token="fresh",
+                expires_at=datetime.now(tz=UTC) + timedelta(hours=1),
+            )
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        def _worker() -> None:
+            barrier.wait()
+            client._ensure_authenticated()
+
+        with patch.object(client, "authenticate", side_effect=_refresh) as mock_auth:
+            threads = [threading.Thread(target=_worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        assert mock_auth.call_count == 1
+        assert client.is_authenticated
+        client.close()
+
+    def test_401_attributed_to_token_actually_sent(self) -> None:
+        """Test a token refreshed during the rate-limit wait is not re-used."""
+        transport = _MockTransport(
+            [
+                httpx.Response(401, json={"error": "expired"}),
+                _make_api_response({"data": "value"}),
+            ]
+        )
+        client = SafewayClient(
+            "user", "pass", "1234", http_client=httpx.Client(transport=transport)
+        )
+        stale = TokenState(
+            access_token="stale",
+            expires_at=datetime.now(tz=UTC) + timedelta(hours=1),
+        )
+        fresh = TokenState(
+            access_token="fresh",
+            expires_at=datetime.now(tz=UTC) + timedelta(hours=1),
+        )
+        client._token = stale
+
+        def _refresh_elsewhere() -> None:
+            client._token = fresh
+
+        with (
+            patch.object(client, "_rate_limit", side_effect=_refresh_elsewhere),
+            patch.object(client, "authenticate") as mock_auth,
+        ):
+            result = client.get("/api/v2/test")
+
+        assert result == {"data": "value"}
+        mock_auth.assert_not_called()
+        sent = [r.headers["Authorization"] for r in transport.requests]
+        assert sent == ["Bearer stale", "Bearer fresh"]
+        client.close()
+
 
 class TestSafewayClientRateLimiting:
     """Tests for rate limiting behavior."""
@@ -143,6 +143,36 @@ class TestSafewayPipelineInit:
         mock_pantry.assert_called_once()
         assert pipeline is not None
 
+    @patch("grocery_butler.safeway_pipeline.RecipeStore")
+    @patch("grocery_butler.safeway_pipeline.ProductSearchService")
+    @patch("grocery_butler.safeway_pipeline.ProductSelector")
+    @patch("grocery_butler.safeway_pipeline.SubstitutionService")
+    @patch("grocery_butler.safeway_pipeline.SafewayClient")
+    @patch("grocery_butler.safeway_pipeline.PantryManager")
+    def test_reuses_given_store_and_pantry(
+        self,
+        mock_pantry: MagicMock,
+        mock_client: MagicMock,
+        mock_sub: MagicMock,
+        mock_selector: MagicMock,
+        mock_search: MagicMock,
+        mock_store: MagicMock,
+        safeway_config: Config,
+    ):
+        """Test passed-in store and pantry manager are not rebuilt."""
+        store = MagicMock()
+        pantry = MagicMock()
+        SafewayPipeline(
+            safeway_config,
+            ":memory:",
+            recipe_store=store,
+            pantry_manager=pantry,
+        )
+
+        mock_store.assert_not_called()
+        mock_pantry.assert_not_called()
+        mock_selector.assert_called_once_with(None, store)
+
     def test_missing_credentials_raises(self, incomplete_config: Config):
         """Test that missing Safeway creds raises error."""
         with pytest.raises(SafewayPipelineError, match="credentials"):